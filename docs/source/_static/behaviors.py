@@ -2,8 +2,6 @@
 Demo source for PyQtLineEditProgressBar
 
 """
-import time
-
 from PyQt5 import QtCore
 from PyQt5 import QtGui
 from PyQt5 import QtWidgets
@@ -67,8 +65,6 @@ class Dialog(QtWidgets.QDialog):
 		self.lineedit4.updateProgress(0.1)
 		#self.lineedit4.setText(self.lineedit4.getBehavior())
 
-		time.sleep(0.5)
-
 app = QtWidgets.QApplication([])
 window = Dialog()
 #window.resize(400, 50)
@@ -2,8 +2,6 @@
 Demo source for PyQtLineEditProgressBar
 
 """
-import time
-
 from PyQt5 import QtCore
 from PyQt5 import QtGui
 from PyQt5 import QtWidgets
@@ -88,8 +86,6 @@ class Dialog(QtWidgets.QDialog):
 		self.lineedit6.updateProgress(0.1)
 		#self.lineedit6.setText(self.lineedit6.getBehavior())
 
-		time.sleep(0.5)
-
 app = QtWidgets.QApplication([])
 window = Dialog()
 #window.resize(400, 50)
@@ -41,6 +41,7 @@ Class PyQtLineEditProgressBar
 # ----------------------------------------------------------------------------
 # ------------------------ Python Standard Library ---------------------------
 # ----------------------------------------------------------------------------
+import functools
 import time
 
 # ----------------------------------------------------------------------------
@@ -49,6 +50,7 @@ import time
 from PyQt5 import QtCore
 from PyQt5 import QtGui
 from PyQt5 import QtWidgets
+from PyQt5 import sip
 
 from colour import Color  # https://pypi.org/project/colour/
 
@@ -97,9 +99,175 @@ BEHAVIOR_MAP = { # init_value, set_color_at_1, set_color_at_3, delta_sign
 
 DEFAULT_BEHAVIOR = STARTS_EMPTY_FILLS_LEFT_TO_RIGHT
 
+# The palette render mode sets the progressbar as the widget's Base palette brush.
+# The painter render mode leaves the palette (and any Qt Style Sheet) alone and
+# paints the progressbar over the styled frame in paintEvent().
+# The snapped render mode paints like the painter mode, but with a solid fill
+# whose edge is snapped to device pixels.
+RENDER_MODE_PALETTE = 'palette'
+RENDER_MODE_PAINTER = 'painter'
+RENDER_MODE_SNAPPED = 'snapped'
+
+RENDER_MODES = [RENDER_MODE_PALETTE, RENDER_MODE_PAINTER, RENDER_MODE_SNAPPED]
+
+DEFAULT_RENDER_MODE = RENDER_MODE_PALETTE
+
+_CLEARED_PALETTE_KEY = 'cleared'
+
+# The interval of every frame timer in the package, such as the one timer
+# shared by every timed ProgressBar that asks them to repaint
+FRAME_INTERVAL_MS = 16   # ~60 frames per second
+
 # ----------------------------------------------------------------------------
 # --------------------- Module Classes & Functions ---------------------------
 # ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=256)
+def _parse_color(color_text):
+	# Parsing with the colour package is slow, and applications reuse a handful of colors
+	try:
+		return(Color(color_text).hex_l)
+	except ValueError:
+		return(EMBEDDED_COLORS[DEFAULT_COLOR_NAME])
+
+def _validate_color(color_text):
+	"""Returns the long hex form of **color_text**, or the default color's
+	hex value if **color_text** is not a color the colour package accepts."""
+	if isinstance(color_text, str):
+		return(_parse_color(color_text.lower()))
+	return(EMBEDDED_COLORS[DEFAULT_COLOR_NAME])
+
+def _validate_behavior(behavior):
+	"""Returns **behavior** if it is one of the four BEHAVIORS, otherwise the DEFAULT_BEHAVIOR."""
+	if isinstance(behavior, str):
+		behavior = behavior.lower()
+		if behavior in BEHAVIORS:
+			return(behavior)
+	return(DEFAULT_BEHAVIOR)
+
+def _advance_value(value, behavior, delta_sign, delta_float):
+	"""Returns the ProgressBar value after an **updateProgress(delta_float)**
+	call, wrapping around at the ends and clamping to [0.001, 0.999]."""
+	if behavior in LEFT_2_RIGHT:
+		if value >= 0.998:
+			value = 0.001
+		elif value > 0.9:
+			value = 0.999
+		else:
+			value = value + (delta_sign * delta_float)
+	elif behavior in RIGHT_2_LEFT:
+		if value <= 0.0010:
+			value = 0.999
+		elif value < 0.100:
+			value = 0.001
+		else:
+			value = value + (delta_sign * delta_float)
+
+	if value > 0.999:
+		value = 0.999
+	if value < 0.001:
+		value = 0.001
+	return(value)
+
+def _progress_fill_rect(rect, edge, param_1):
+	"""Returns the QRectF of **rect** that is filled with the progressbar color
+	when the fill ends at the x coordinate **edge**. Behaviors with a negative
+	**param_1** fill to the left of the edge, the others to the right."""
+	if param_1 < 0:
+		return(QtCore.QRectF(rect.x(), rect.y(), edge - rect.x(), rect.height()))
+	return(QtCore.QRectF(edge, rect.y(), rect.x() + rect.width() - edge, rect.height()))
+
+def _snapped_fill_edge(rect, value, ratio):
+	"""Returns the x coordinate, in device pixels, where a progressbar of
+	**value** across **rect** ends, snapped to a device pixel for a device
+	pixel **ratio**."""
+	return(int(round((rect.x() + value * rect.width()) * ratio)))
+
+def _snapped_repaint_rect(rect, old_edge, new_edge, ratio):
+	"""Returns the QRect of **rect** to repaint when a snapped fill edge moves
+	from **old_edge** to **new_edge**, in device pixels: only the strip between
+	the two edges, all of **rect** if there was no old edge, or None if the edge
+	has not moved."""
+	if new_edge == old_edge:
+		return(None)
+	if old_edge is None:
+		return(QtCore.QRect(rect))
+	left = int(min(old_edge, new_edge) / ratio) - 1
+	right = int(max(old_edge, new_edge) / ratio) + 2
+	return(QtCore.QRect(left, rect.y(), right - left, rect.height()))
+
+def _text_position(rect, text_size, alignment, margin):
+	"""Returns the QPointF at which text of **text_size** is drawn in **rect**,
+	vertically centered and horizontally placed by **alignment**, **margin**
+	pixels in from the left or right edge."""
+	if alignment & QtCore.Qt.AlignRight:
+		x = rect.right() - margin - text_size.width()
+	elif alignment & QtCore.Qt.AlignHCenter:
+		x = rect.x() + (rect.width() - text_size.width()) / 2.0
+	else:
+		x = rect.x() + margin
+	return(QtCore.QPointF(x, rect.y() + (rect.height() - text_size.height()) / 2.0))
+
+def _fraction_to_value(fraction, behavior):
+	"""Maps the fraction of work completed, between 0.0 and 1.0, to the
+	ProgressBar value that **behavior** displays for it."""
+	init_value, _, _, delta_sign = BEHAVIOR_MAP[behavior]
+	fraction = min(max(fraction, 0.0), 1.0)
+	return(init_value + (delta_sign * fraction * 0.998))
+
+class _TimedProgressTicker(QtCore.QObject):
+	"""The single timer that drives the repaints of every timed ProgressBar,
+	so timed bars need no timer or producer calls of their own."""
+
+	def __init__(self, parent=None):
+		super(_TimedProgressTicker, self).__init__(parent)
+		self._bars = set()
+		self._timer = QtCore.QTimer(self)
+		self._timer.setInterval(FRAME_INTERVAL_MS)
+		self._timer.timeout.connect(self._tick)
+
+	def add(self, bar):
+		self._bars.add(bar)
+		if not self._timer.isActive():
+			self._timer.start()
+
+	def discard(self, bar):
+		self._bars.discard(bar)
+		if not self._bars:
+			self._timer.stop()
+
+	def _tick(self):
+		for bar in list(self._bars):
+			try:
+				finished = bar._tick_timed_progress()
+			except RuntimeError:  # The underlying C++ widget has been deleted
+				finished = True
+			if finished:
+				self.discard(bar)
+
+_timed_progress_ticker = None
+
+def _get_timed_progress_ticker():
+	# The ticker belongs to the application, and is recreated along with it,
+	# so a process that creates a second QApplication gets a live timer.
+	global _timed_progress_ticker
+	app = QtCore.QCoreApplication.instance()
+	if (_timed_progress_ticker is None or sip.isdeleted(_timed_progress_ticker)
+			or _timed_progress_ticker.parent() is not app):
+		_timed_progress_ticker = _TimedProgressTicker(app)
+	return(_timed_progress_ticker)
+
+# https://doc.qt.io/qtforpython/PySide2/QtGui/QLinearGradient.html#detailed-description
+# https://doc.qt.io/qt-5/qlineargradient.html#details
+def _progress_gradient(rectf, value, param_1, param_3, color):
+	"""Returns the QLinearGradient that draws a progressbar of **value** across
+	**rectf**, with the fill side picked by the behavior's **param_1** and **param_3**."""
+	gradient = QtGui.QLinearGradient(rectf.topLeft(), rectf.topRight())
+	# https://doc.qt.io/qt-5/qgradient.html#setColorAt
+	gradient.setColorAt(value+param_1, QtGui.QColor(color))
+	gradient.setColorAt(value, QtGui.QColor('#ffffff'))
+	gradient.setColorAt(value+param_3, QtGui.QColor('#ffffff'))
+	return(gradient)
+
 # https://doc.qt.io/qt-5/qlineedit.html
 class PyQtLineEditProgressBar(QtWidgets.QLineEdit):
 
@@ -108,6 +276,7 @@ class PyQtLineEditProgressBar(QtWidgets.QLineEdit):
 				progressbar_color=EMBEDDED_COLORS[DECN[0]], 
 				behavior=DEFAULT_BEHAVIOR,
 				text_for_bounding_rect=None,
+				render_mode=DEFAULT_RENDER_MODE,
 				):
 		"""Constructor for the PyQtLineEditProgressBar Class
 
@@ -164,6 +333,18 @@ class PyQtLineEditProgressBar(QtWidgets.QLineEdit):
 
 		  If not specified, then the standard Qt sizeHint() is called.
 
+		render_mode : str, optional
+		  How the progressbar is drawn, one of:
+
+		    **pyqtlineeditprogressbar.RENDER_MODE_PALETTE**
+		    **pyqtlineeditprogressbar.RENDER_MODE_PAINTER**
+		    **pyqtlineeditprogressbar.RENDER_MODE_SNAPPED**
+
+		  The default, **RENDER_MODE_PALETTE**, draws the progressbar with the
+		  widget's palette. Use **RENDER_MODE_PAINTER** in applications styled
+		  with Qt Style Sheets, or **RENDER_MODE_SNAPPED** on high-DPI displays,
+		  see **setRenderMode()**.
+
 
 		Returns
 		-------
@@ -179,44 +360,189 @@ class PyQtLineEditProgressBar(QtWidgets.QLineEdit):
 		self._text_for_bounding_rect = text_for_bounding_rect
 		
 		self._size_hint_qrect = None
+		self._render_mode = DEFAULT_RENDER_MODE
+		self._progressbar_shown = True
+		self._snapped_edge = None
+
+		# The palette render mode keeps one palette per widget and only swaps
+		# its Base brush, keyed so unchanged updates skip setPalette() entirely.
+		self._palette = self.palette()
+		self._palette_key = None
+
+		# Timed progress, see startTimedProgress()
+		self._timed_duration = None
+		self._timed_started = 0.0
+		self._timed_elapsed = 0.0
+		self._timed_paused = False
+
+		# Called with the duration of each paint, see paintEvent()
+		self._paint_observer = None
 
 		if self._contents:
 			self.setText(self._contents)
 		self.setReadOnly(read_only)
 		self.setProgressBarColor(progressbar_color)
 		self.setProgressBarBehavior(behavior)
+		self.setRenderMode(render_mode)
 
 		self._update_progress_bar()
 
-	# https://doc.qt.io/qtforpython/PySide2/QtGui/QLinearGradient.html#detailed-description
-	# https://doc.qt.io/qt-5/qlineargradient.html#details
 	def _update_progress_bar(self):
-
-		palette = self.palette()
-		QRectF = QtCore.QRectF(self.rect())
-		gradient = QtGui.QLinearGradient(QRectF.topLeft(), QRectF.topRight())
-		# https://doc.qt.io/qt-5/qgradient.html#setColorAt
-		gradient.setColorAt(self._value+self._param_1, QtGui.QColor(self._color))
-		gradient.setColorAt(self._value, QtGui.QColor('#ffffff'))
-		gradient.setColorAt(self._value+self._param_3, QtGui.QColor('#ffffff'))
-		palette.setBrush(QtGui.QPalette.Base, QtGui.QBrush(gradient))
-		self.setPalette(palette)		
+		if self._render_mode == RENDER_MODE_SNAPPED and self._progressbar_shown:
+			self._update_snapped_edge()
+			return
+
+		self._progressbar_shown = True
+		if self._render_mode != RENDER_MODE_PALETTE:
+			self.update()
+			return
+
+		width = self.width()
+		key = (self._value, self._param_1, self._color, width)
+		if key == self._palette_key:
+			return
+
+		QRectF = QtCore.QRectF(0, 0, width, self.height())
+		gradient = _progress_gradient(QRectF, self._value, self._param_1, self._param_3, self._color)
+		self._set_base_brush(key, QtGui.QBrush(gradient))
+
+	def _set_base_brush(self, key, brush):
+		self._palette_key = key
+		self._palette.setBrush(QtGui.QPalette.Base, brush)
+		self.setPalette(self._palette)
 	
+	def _update_snapped_edge(self):
+		# Repaint only the strip between the old and new fill edges, and
+		# nothing at all if the edge lands on the same device pixel.
+		ratio = self.devicePixelRatioF()
+		edge = _snapped_fill_edge(self._progress_rect(), self._value, ratio)
+		strip = _snapped_repaint_rect(self.rect(), self._snapped_edge, edge, ratio)
+		if strip is not None:
+			self._snapped_edge = edge
+			self.update(strip)
+
+	def _timed_fraction(self):
+		elapsed = self._timed_elapsed
+		if not self._timed_paused:
+			elapsed += time.monotonic() - self._timed_started
+		if self._timed_duration <= 0:
+			return(1.0)
+		return(min(elapsed / self._timed_duration, 1.0))
+
+	def _sync_timed_value(self):
+		# Derived from the clock each time, so there is no accumulated drift
+		fraction = self._timed_fraction()
+		self._value = _fraction_to_value(fraction, self._progressbar_behavior)
+		return(fraction)
+
+	def _tick_timed_progress(self):
+		# Called by the shared ticker, returns True once the timed progress is over
+		if self._timed_duration is None or self._timed_paused:
+			return(True)
+
+		if self._render_mode == RENDER_MODE_PAINTER:
+			# The value is derived in paintEvent(), if the widget paints at all
+			self.update()
+			return(self._timed_fraction() >= 1.0)
+
+		# The palette has to be set, and the snapped edge checked, before painting.
+		# Hidden bars are only brought up to date once they finish, when the
+		# ticker drops them, so they show the final state when shown again.
+		if not self.isVisible() and self._timed_fraction() < 1.0:
+			return(False)
+		finished = self._sync_timed_value() >= 1.0
+		if self._progressbar_shown:
+			self._update_progress_bar()
+		return(finished)
+
 	def _clear_progress_bar(self):
-		palette = self.palette()
-		QRectF = QtCore.QRectF(self.rect())
-		gradient = QtGui.QLinearGradient(QRectF.topLeft(), QRectF.topRight())
-		# https://doc.qt.io/qt-5/qgradient.html#setColorAt
-		gradient.setColorAt(0, QtGui.QColor('#ffffff'))
-		#gradient.setColorAt(value, QtGui.QColor('#ffffff'))
-		gradient.setColorAt(1, QtGui.QColor('#ffffff'))
-		palette.setBrush(QtGui.QPalette.Base, QtGui.QBrush(gradient))
-		self.setPalette(palette)		
+		self._progressbar_shown = False
+		self._snapped_edge = None
+		if self._render_mode != RENDER_MODE_PALETTE:
+			self.update()
+			return
+
+		if self._palette_key == _CLEARED_PALETTE_KEY:
+			return
+		self._set_base_brush(_CLEARED_PALETTE_KEY, QtGui.QBrush(QtGui.QColor('#ffffff')))
 
 	# -------------------------------------------------------------------------
 	# QLineEdit Methods that are over-ridden
 	# -------------------------------------------------------------------------
 	
+	def _progress_rect(self):
+		# The area inside the frame that the painter render modes fill
+		rect = self.rect()
+		if self.hasFrame():
+			option = QtWidgets.QStyleOptionFrame()
+			self.initStyleOption(option)
+			frame_width = self.style().pixelMetric(QtWidgets.QStyle.PM_DefaultFrameWidth, option, self)
+			rect = rect.adjusted(frame_width, frame_width, -frame_width, -frame_width)
+		return(rect)
+
+	def paintEvent(self, event):
+		"""This overrides QLineEdit's paintEvent() method to draw the progressbar
+		over the styled frame when the render mode is **RENDER_MODE_PAINTER** or
+		**RENDER_MODE_SNAPPED**.
+
+		The progressbar is multiplied onto whatever the style (or style sheet)
+		has already drawn, so the white part of the gradient leaves the frame
+		untouched and the text stays legible on top of the colored part.
+
+		If a paint observer has been set, for example by a
+		**pyqtlineeditprogressbar.governor.FrameBudgetGovernor**, it is called
+		with the seconds each paint took.
+		"""
+		if self._paint_observer is None:
+			self._paint_progress_bar(event)
+			return
+
+		started = time.perf_counter()
+		self._paint_progress_bar(event)
+		self._paint_observer(time.perf_counter() - started)
+
+	def _paint_progress_bar(self, event):
+		super(PyQtLineEditProgressBar, self).paintEvent(event)
+
+		if self._render_mode == RENDER_MODE_PALETTE or not self._progressbar_shown:
+			return
+
+		if self._timed_duration is not None:
+			self._sync_timed_value()
+
+		rect = self._progress_rect()
+		painter = QtGui.QPainter(self)
+		painter.setCompositionMode(QtGui.QPainter.CompositionMode_Multiply)
+
+		if self._render_mode == RENDER_MODE_SNAPPED:
+			ratio = self.devicePixelRatioF()
+			self._snapped_edge = _snapped_fill_edge(rect, self._value, ratio)
+			edge = self._snapped_edge / ratio
+			painter.fillRect(_progress_fill_rect(rect, edge, self._param_1), QtGui.QColor(self._color))
+		else:
+			QRectF = QtCore.QRectF(rect)
+			gradient = _progress_gradient(QRectF, self._value, self._param_1, self._param_3, self._color)
+			painter.fillRect(QRectF, QtGui.QBrush(gradient))
+
+		painter.end()
+
+	def changeEvent(self, event):
+		"""This overrides QLineEdit's changeEvent() method to re-sync the widget's
+		palette when the application palette or style changes, so that a theme
+		switch updates every progressbar in the single pass Qt makes over its
+		widgets, without the progressbar losing its Base brush.
+		"""
+		super(PyQtLineEditProgressBar, self).changeEvent(event)
+
+		if event.type() in (QtCore.QEvent.ApplicationPaletteChange, QtCore.QEvent.StyleChange):
+			self._palette = self.palette()
+			if self._render_mode == RENDER_MODE_PALETTE and self._palette_key is not None:
+				self._palette_key = None
+				if self._progressbar_shown:
+					self._update_progress_bar()
+				else:
+					self._clear_progress_bar()
+
 	def sizeHint(self):
 		"""This overrides QLineEdit's sizeHint() method only if the constructor
 		parameter **text_for_bounding_rect** is specified. In which case the
@@ -274,28 +600,16 @@ class PyQtLineEditProgressBar(QtWidgets.QLineEdit):
 		-------
 		None
 		  Nothing
-		"""
 
-		if self._progressbar_behavior in LEFT_2_RIGHT:
-			if self._value >= 0.998:
-				self._value = 0.001
-			elif self._value > 0.9:
-				self._value = 0.999
-			else:
-				self._value = self._value + (self._delta_sign * delta_float)
-		elif self._progressbar_behavior in RIGHT_2_LEFT:
-			if self._value <= 0.0010:
-				self._value = 0.999
-			elif self._value < 0.100:
-				self._value = 0.001
-			else:
-				self._value = self._value + (self._delta_sign * delta_float)
-
-		if self._value > 0.999:
-			self._value = 0.999
-		if self._value < 0.001:
-			self._value = 0.001
+		Note
+		----
+		  Ignored while timed progress is on, from **startTimedProgress()** until
+		  **stopTimedProgress()**, even once the timed run has finished.
+		"""
+		if self._timed_duration is not None:
+			return
 
+		self._value = _advance_value(self._value, self._progressbar_behavior, self._delta_sign, delta_float)
 		self._update_progress_bar()
 
 	def removeProgressBar(self):
@@ -331,15 +645,10 @@ class PyQtLineEditProgressBar(QtWidgets.QLineEdit):
 		  If this method detects an invalid **color_text** parameter has been specified, the color will be set to the default color
 		  which is **pyqtlineeditprogressbar.DEFAULT_COLOR_GREEN**.
 		"""
-		if isinstance(color_text, str):
-			color_text = color_text.lower()
-			try:
-				c = Color(color_text)
-				self._color = c.hex_l
-			except ValueError:
-				self._color  = EMBEDDED_COLORS[DEFAULT_COLOR_NAME]
-		else:
-			self._color  = EMBEDDED_COLORS[DEFAULT_COLOR_NAME]
+		self._color = _validate_color(color_text)
+		# The snapped render mode only repaints when the edge moves, so make
+		# the next update repaint in full
+		self._snapped_edge = None
 
 	def getProgressBarColor(self):
 		"""Returns the color value associated with the ProgressBar."""
@@ -370,16 +679,9 @@ class PyQtLineEditProgressBar(QtWidgets.QLineEdit):
 		value of **pyqtlineeditprogressbar.STARTS_EMPTY_FILLS_LEFT_TO_RIGHT**.
 
 		"""
-		if isinstance(behavior, str):
-			behavior = behavior.lower()
-			if behavior in BEHAVIORS:
-				self._progressbar_behavior = behavior
-			else:
-				self._progressbar_behavior = DEFAULT_BEHAVIOR
-		else:
-			self._progressbar_behavior = DEFAULT_BEHAVIOR
-
+		self._progressbar_behavior = _validate_behavior(behavior)
 		self._value, self._param_1, self._param_3, self._delta_sign = BEHAVIOR_MAP[self._progressbar_behavior]
+		self._snapped_edge = None
 
 	def getBehavior(self):
 		"""Returns the how the ProgressBar is configured to behave.
@@ -416,4 +718,189 @@ class PyQtLineEditProgressBar(QtWidgets.QLineEdit):
 		float
 		  Current value of the ProgressBar, between 0.0 and 1.0.
 		"""
+		if self._timed_duration is not None:
+			self._sync_timed_value()
 		return(self._value)
+
+	def setValue(self, value_float):
+		"""Sets the current value of the ProgressBar directly, rather than
+		incrementally as **updateProgress()** does.
+
+		Parameters
+		----------
+		value_float : float
+		  The new value of the ProgressBar, between 0.0 and 1.0. It is clamped
+		  to the same [0.001, 0.999] range **updateProgress()** uses.
+
+		Returns
+		-------
+		None
+		  Nothing
+
+		Note
+		----
+		  Ignored while timed progress is on, as for **updateProgress()**.
+		"""
+		if self._timed_duration is not None:
+			return
+
+		self._value = min(max(value_float, 0.001), 0.999)
+		self._update_progress_bar()
+
+	def setProgressFraction(self, fraction):
+		"""Sets the ProgressBar from the fraction of work completed, taking the
+		configured behavior into account. A fraction of 0.0 shows the behavior's
+		initial state (empty or full) and 1.0 its final state.
+
+		Parameters
+		----------
+		fraction : float
+		  The fraction of work completed, between 0.0 and 1.0.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		self.setValue(_fraction_to_value(fraction, self._progressbar_behavior))
+
+	def setRenderMode(self, render_mode):
+		"""Configures how the ProgressBar is drawn.
+
+		Parameters
+		----------
+		render_mode : str
+		  Must be one of the render mode constants:
+
+		    **pyqtlineeditprogressbar.RENDER_MODE_PALETTE**
+		    **pyqtlineeditprogressbar.RENDER_MODE_PAINTER**
+		    **pyqtlineeditprogressbar.RENDER_MODE_SNAPPED**
+
+		  **RENDER_MODE_PALETTE** sets the ProgressBar as the widget's Base
+		  palette brush on every update, which Qt Style Sheets override.
+
+		  **RENDER_MODE_PAINTER** never touches the palette or the style sheet.
+		  Updates only schedule a repaint, and the ProgressBar is painted over
+		  the styled frame, so it works under application-wide style sheets
+		  without the cost of re-polishing the widget on every update.
+
+		  **RENDER_MODE_SNAPPED** paints like **RENDER_MODE_PAINTER**, but with a
+		  solid fill whose hard edge is snapped to a device pixel using the
+		  widget's devicePixelRatioF(). Instead of a sub-pixel antialiased edge
+		  that shifts every update, an update only repaints the strip between the
+		  old and new edge, and is skipped when the edge lands on the same pixel.
+
+		Returns
+		-------
+		None
+		  Nothing
+
+		Note
+		----
+		If the render mode is not one of the acceptable values, it will be set to the default
+		value of **pyqtlineeditprogressbar.RENDER_MODE_PALETTE**. Switching away from
+		**RENDER_MODE_PALETTE** resets the widget to the palette it inherits.
+
+		"""
+		if isinstance(render_mode, str) and render_mode.lower() in RENDER_MODES:
+			render_mode = render_mode.lower()
+		else:
+			render_mode = DEFAULT_RENDER_MODE
+
+		if render_mode == self._render_mode:
+			return
+
+		if self._render_mode == RENDER_MODE_PALETTE:
+			self.setPalette(QtGui.QPalette())
+			self._palette = self.palette()
+			self._palette_key = None
+		self._render_mode = render_mode
+		self._snapped_edge = None
+
+		if self._progressbar_shown:
+			self._update_progress_bar()
+		else:
+			self._clear_progress_bar()
+
+	def getRenderMode(self):
+		"""Returns the render mode of the ProgressBar, one of **pyqtlineeditprogressbar.RENDER_MODES**."""
+		return(self._render_mode)
+
+	def startTimedProgress(self, duration_float):
+		"""Starts driving the ProgressBar from a monotonic clock rather than from
+		**updateProgress()** calls. The ProgressBar goes from its initial state to
+		its final state over **duration_float** seconds.
+
+		The value is never accumulated. It is computed from **time.monotonic()**
+		whenever the widget paints or **getValue()** is called, and a single timer
+		shared by every timed ProgressBar asks them to repaint. Countdown and
+		deadline bars therefore need no timer or producer calls of their own.
+
+		From now until **stopTimedProgress()** is called, including after the
+		timed run has finished, **updateProgress()** and **setValue()** are
+		ignored, in every render mode. **removeProgressBar()** removes the
+		ProgressBar until **stopTimedProgress()** or **startTimedProgress()** is
+		called, while the value keeps following the clock.
+
+		Parameters
+		----------
+		duration_float : float
+		  The expected duration, in seconds.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		self._timed_duration = float(duration_float)
+		self._timed_started = time.monotonic()
+		self._timed_elapsed = 0.0
+		self._timed_paused = False
+		self._progressbar_shown = True
+		_get_timed_progress_ticker().add(self)
+
+	def pauseTimedProgress(self):
+		"""Pauses timed progress, freezing the ProgressBar until **resumeTimedProgress()**."""
+		if self._timed_duration is None or self._timed_paused:
+			return
+		self._timed_elapsed += time.monotonic() - self._timed_started
+		self._timed_paused = True
+		_get_timed_progress_ticker().discard(self)
+		# Show exactly the value getValue() reports while paused
+		self._sync_timed_value()
+		self._update_progress_bar()
+
+	def resumeTimedProgress(self):
+		"""Resumes timed progress paused by **pauseTimedProgress()**."""
+		if self._timed_duration is None or not self._timed_paused:
+			return
+		self._timed_started = time.monotonic()
+		self._timed_paused = False
+		_get_timed_progress_ticker().add(self)
+
+	def setTimedProgressDuration(self, duration_float):
+		"""Revises the expected duration of timed progress, in seconds. Time
+		already elapsed is kept, so the ProgressBar jumps to the fraction of the
+		new duration that has passed."""
+		if self._timed_duration is None:
+			return
+		self._timed_duration = float(duration_float)
+		if self._timed_paused:
+			self._sync_timed_value()
+			self._update_progress_bar()
+		else:
+			_get_timed_progress_ticker().add(self)
+
+	def stopTimedProgress(self):
+		"""Stops timed progress, leaving the ProgressBar at its current value
+		for **updateProgress()** and **setValue()** to continue from."""
+		if self._timed_duration is None:
+			return
+		self._sync_timed_value()
+		self._timed_duration = None
+		_get_timed_progress_ticker().discard(self)
+		self._update_progress_bar()
+
+	def isTimedProgressActive(self):
+		"""Returns True while timed progress is running (started and not paused or finished)."""
+		return(self._timed_duration is not None and not self._timed_paused and self._timed_fraction() < 1.0)
@@ -0,0 +1,261 @@
+"""
+.. module:: pyqtlineeditprogressbar.benchmark
+
+**Benchmarks**
+
+Rendering benchmarks for the PyQtLineEditProgressBar widget.
+
+Each benchmark lays out a column of progress bars in a top level window,
+applies an application wide Qt Style Sheet (as a themed application would),
+then times a number of update cycles. A cycle updates every bar and processes
+events so that the resulting polish and paint work is included in the timing.
+
+Run it from the root of the project like this::
+
+    python -m pyqtlineeditprogressbar.benchmark --bars 200 --cycles 100
+
+On a headless machine set **QT_QPA_PLATFORM=offscreen** first.
+
+"""
+# ----------------------------------------------------------------------------
+# ------------------------ Python Standard Library ---------------------------
+# ----------------------------------------------------------------------------
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import time
+
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import QtWidgets
+
+import pyqtlineeditprogressbar as pqtpbar
+from pyqtlineeditprogressbar import PyQtLineEditProgressBar
+from pyqtlineeditprogressbar.display import PyQtDisplayProgressBar
+from pyqtlineeditprogressbar.panel import ProgressPanel
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+APPLICATION_STYLE_SHEET = """
+QLineEdit {
+	border: 1px solid #8f8f91;
+	border-radius: 4px;
+	padding: 1px 4px;
+	background: #ffffff;
+	color: #202020;
+}
+"""
+
+# The workaround the painter render mode replaces, a per widget style sheet
+# regenerated on every update
+STYLE_SHEET_TEMPLATE = (
+	"QLineEdit {{ background: qlineargradient(x1:0, y1:0, x2:1, y2:0, "
+	"stop:0 {color}, stop:{edge:.4f} {color}, stop:{white:.4f} #ffffff, stop:1 #ffffff); }}"
+)
+
+DELTA = 0.01
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+def _application():
+	app = QtWidgets.QApplication.instance()
+	if app is None:
+		app = QtWidgets.QApplication([])
+	app.setStyleSheet(APPLICATION_STYLE_SHEET)
+	return(app)
+
+def _run(bars, cycles, create, update):
+	"""Times **cycles** update cycles over **bars** widgets made by **create**,
+	returning the mean milliseconds per cycle."""
+	app = _application()
+	window = QtWidgets.QWidget()
+	layout = QtWidgets.QVBoxLayout(window)
+	widgets = []
+	for i in range(bars):
+		widget = create(i)
+		layout.addWidget(widget)
+		widgets.append(widget)
+	window.show()
+	app.processEvents()
+
+	start = time.perf_counter()
+	for _ in range(cycles):
+		for widget in widgets:
+			update(widget)
+		app.processEvents()
+	elapsed = time.perf_counter() - start
+
+	window.close()
+	window.deleteLater()
+	app.processEvents()
+	return(1000.0 * elapsed / cycles)
+
+def _rss_bytes():
+	try:
+		with open('/proc/self/statm') as statm:
+			return(int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE'))
+	except (OSError, ValueError, AttributeError):
+		import resource  # Peak rather than current, but the best available
+		return(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+
+def measure_memory(create, count=1000):
+	"""Returns the resident memory, in bytes, used by each of **count** widgets
+	made by **create**, laid out and shown in a window."""
+	app = _application()
+	window = QtWidgets.QWidget()
+	layout = QtWidgets.QVBoxLayout(window)
+	gc.collect()
+	app.processEvents()
+
+	# A fixed window size keeps the backing store out of the measurement
+	window.setFixedSize(400, 300)
+	window.show()
+	app.processEvents()
+
+	before = _rss_bytes()
+	widgets = [create(i) for i in range(count)]
+	for widget in widgets:
+		layout.addWidget(widget)
+	app.processEvents()
+	after = _rss_bytes()
+
+	window.close()
+	window.deleteLater()
+	app.processEvents()
+	return((after - before) / float(count))
+
+def _create_line_edit(i):
+	widget = QtWidgets.QLineEdit('bar {}'.format(i))
+	widget.setReadOnly(True)
+	widget.progress_value = 0.0
+	return(widget)
+
+def _update_style_sheet(widget):
+	value = widget.progress_value + DELTA
+	if value > 0.999:
+		value = 0.001
+	widget.progress_value = value
+	widget.setStyleSheet(STYLE_SHEET_TEMPLATE.format(
+		color=pqtpbar.DEFAULT_COLOR_GREEN, edge=value, white=value + 0.001))
+
+def _render_mode_factory(render_mode):
+	def create(i):
+		return(PyQtLineEditProgressBar(
+					contents='bar {}'.format(i),
+					behavior=pqtpbar.BEHAVIORS[i % len(pqtpbar.BEHAVIORS)],
+					render_mode=render_mode))
+	return(create)
+
+def _update_progress(widget):
+	widget.updateProgress(DELTA)
+
+def benchmark_style_sheet(bars=200, cycles=100):
+	"""Returns the mean milliseconds per update cycle when every update
+	regenerates a per widget style sheet string on a plain QLineEdit."""
+	return(_run(bars, cycles, _create_line_edit, _update_style_sheet))
+
+def benchmark_render_mode(render_mode, bars=200, cycles=100):
+	"""Returns the mean milliseconds per update cycle of PyQtLineEditProgressBar
+	widgets drawn with **render_mode**."""
+	return(_run(bars, cycles, _render_mode_factory(render_mode), _update_progress))
+
+def benchmark_palette(bars=200, cycles=100):
+	"""Returns the mean milliseconds per update cycle using the default
+	**RENDER_MODE_PALETTE**."""
+	return(benchmark_render_mode(pqtpbar.RENDER_MODE_PALETTE, bars, cycles))
+
+def benchmark_painter(bars=200, cycles=100):
+	"""Returns the mean milliseconds per update cycle using
+	**RENDER_MODE_PAINTER**, with no style sheet or palette mutation."""
+	return(benchmark_render_mode(pqtpbar.RENDER_MODE_PAINTER, bars, cycles))
+
+def _create_display(i):
+	return(PyQtDisplayProgressBar(
+				contents='bar {}'.format(i),
+				behavior=pqtpbar.BEHAVIORS[i % len(pqtpbar.BEHAVIORS)]))
+
+def benchmark_display(bars=200, cycles=100):
+	"""Returns the mean milliseconds per update cycle of the display-only
+	PyQtDisplayProgressBar."""
+	return(_run(bars, cycles, _create_display, _update_progress))
+
+def benchmark_panel(bars=200, cycles=100):
+	"""Returns the mean milliseconds per update cycle of a single ProgressPanel
+	painting **bars** rows."""
+	app = _application()
+	window = QtWidgets.QScrollArea()
+	panel = ProgressPanel()
+	for i in range(bars):
+		panel.addBar('bar {}'.format(i), behavior=pqtpbar.BEHAVIORS[i % len(pqtpbar.BEHAVIORS)])
+	window.setWidget(panel)
+	window.setWidgetResizable(True)
+	window.show()
+	app.processEvents()
+
+	start = time.perf_counter()
+	for _ in range(cycles):
+		for row in range(bars):
+			panel.updateProgress(row, DELTA)
+		app.processEvents()
+	elapsed = time.perf_counter() - start
+
+	window.close()
+	window.deleteLater()
+	app.processEvents()
+	return(1000.0 * elapsed / cycles)
+
+def benchmark_snapped(bars=200, cycles=100):
+	"""Returns the mean milliseconds per update cycle using
+	**RENDER_MODE_SNAPPED**, which skips repaints of unchanged fill edges."""
+	return(benchmark_render_mode(pqtpbar.RENDER_MODE_SNAPPED, bars, cycles))
+
+BENCHMARKS = [
+	('style sheet string per update', benchmark_style_sheet),
+	('RENDER_MODE_PALETTE', benchmark_palette),
+	('RENDER_MODE_PAINTER', benchmark_painter),
+	('RENDER_MODE_SNAPPED', benchmark_snapped),
+	('PyQtDisplayProgressBar', benchmark_display),
+	('ProgressPanel', benchmark_panel),
+]
+
+MEMORY_BENCHMARKS = [
+	('PyQtLineEditProgressBar', _render_mode_factory(pqtpbar.DEFAULT_RENDER_MODE)),
+	('PyQtDisplayProgressBar', _create_display),
+]
+
+# ----------------------------------------------------------------------------
+def main():
+	parser = argparse.ArgumentParser(description='PyQtLineEditProgressBar rendering benchmarks')
+	parser.add_argument('--bars', type=int, default=200, help='number of progress bars')
+	parser.add_argument('--cycles', type=int, default=100, help='number of update cycles')
+	parser.add_argument('--memory', type=int, default=None, help=argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	_application()
+	if args.memory is not None:
+		print(measure_memory(MEMORY_BENCHMARKS[args.memory][1], args.bars))
+		return
+
+	print('{} bars, {} cycles'.format(args.bars, args.cycles))
+	for name, benchmark in BENCHMARKS:
+		print('{:<40} {:8.2f} ms/cycle'.format(name, benchmark(args.bars, args.cycles)))
+
+	# Memory is measured in a fresh process each time, otherwise memory freed
+	# by the previous benchmarks is reused and hides the real cost
+	for index, (name, _) in enumerate(MEMORY_BENCHMARKS):
+		output = subprocess.check_output([sys.executable, '-m', 'pyqtlineeditprogressbar.benchmark',
+										'--bars', str(args.bars), '--memory', str(index)])
+		per_instance = float(output.decode().strip().splitlines()[-1])
+		print('{:<40} {:8.1f} KiB/instance'.format(name, per_instance / 1024.0))
+
+# ----------------------------------------------------------------------------
+# ----------------------------- main -----------------------------------------
+# ----------------------------------------------------------------------------
+if __name__ == "__main__":
+	main()
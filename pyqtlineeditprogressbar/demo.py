@@ -2,8 +2,6 @@
 Demo source for PyQtLineEditProgressBar
 
 """
-import time
-
 from PyQt5 import QtCore
 from PyQt5 import QtGui
 from PyQt5 import QtWidgets
@@ -96,8 +94,6 @@ class Dialog(QtWidgets.QDialog):
 
 		self.lineedit7.updateProgress(0.1)
 
-		time.sleep(1)
-
 # ----------------------------------------------------------------------------
 def main():
 	app = QtWidgets.QApplication([])
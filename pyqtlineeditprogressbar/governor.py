@@ -0,0 +1,299 @@
+"""
+.. module:: pyqtlineeditprogressbar.governor
+
+**FrameBudgetGovernor**
+
+Keeps progress rendering within a per frame time budget.
+
+When the GUI thread is busy, hundreds of bars repainting at full rate make the
+whole UI lag. Progress updates for registered bars go through the governor
+instead of straight to the bars. The governor applies them once per frame,
+coalescing every update a bar received since the last frame, and measures the
+time each frame spends applying updates and painting the bars.
+
+When that time stays over the budget, the governor degrades rendering one
+level at a time, and restores it one level at a time once the load subsides:
+
+    **DEGRADATION_NONE**
+      Every frame applies all pending updates.
+
+    **DEGRADATION_REDUCED_RATE**
+      Pending updates are applied every other frame.
+
+    **DEGRADATION_SOLID_FILL**
+      As above, and bars drawn with a gradient switch to
+      **RENDER_MODE_SNAPPED**, a solid fill that skips unchanged repaints.
+
+    **DEGRADATION_FOCUS_ONLY**
+      Updates are applied every fourth frame, and only to bars that are
+      visible in the active window. Updates to other bars are held back,
+      coalesced, and applied once they come into focus or the level drops,
+      so no progress is lost.
+
+::
+
+    governor = FrameBudgetGovernor(budget_ms=4.0)
+    for bar in bars:
+        governor.register(bar)
+    governor.degradationLevelChanged.connect(status_bar.showLevel)
+
+    governor.updateProgress(bar, 0.01)   # instead of bar.updateProgress(0.01)
+
+"""
+# ----------------------------------------------------------------------------
+# ------------------------ Python Standard Library ---------------------------
+# ----------------------------------------------------------------------------
+import time
+
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import QtCore
+
+import pyqtlineeditprogressbar as pqtpbar
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+DEGRADATION_NONE = 0
+DEGRADATION_REDUCED_RATE = 1
+DEGRADATION_SOLID_FILL = 2
+DEGRADATION_FOCUS_ONLY = 3
+
+DEGRADATION_LEVELS = [DEGRADATION_NONE, DEGRADATION_REDUCED_RATE,
+					  DEGRADATION_SOLID_FILL, DEGRADATION_FOCUS_ONLY]
+
+# Pending updates are applied every Nth frame at each level
+FRAME_STRIDES = {
+	DEGRADATION_NONE : 1,
+	DEGRADATION_REDUCED_RATE : 2,
+	DEGRADATION_SOLID_FILL : 2,
+	DEGRADATION_FOCUS_ONLY : 4,
+}
+
+DEFAULT_BUDGET_MS = 4.0
+
+ESCALATE_AFTER_FRAMES = 5        # consecutive frames over budget before degrading further
+RECOVER_AFTER_FRAMES = 30        # consecutive frames under RECOVER_RATIO * budget before recovering
+RECOVER_RATIO = 0.5
+SMOOTHING = 0.2                  # weight of the newest frame in the moving average
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+class FrameBudgetGovernor(QtCore.QObject):
+
+	degradationLevelChanged = QtCore.pyqtSignal(int)
+
+	def __init__(self, budget_ms=DEFAULT_BUDGET_MS, frame_interval_ms=pqtpbar.FRAME_INTERVAL_MS, parent=None):
+		"""Constructor for the FrameBudgetGovernor Class
+
+		Parameters
+		----------
+		budget_ms : float, optional
+		  The milliseconds per frame progress rendering may take before the
+		  governor starts degrading it.
+
+		frame_interval_ms : int, optional
+		  The interval of the governor's frame timer, in milliseconds.
+
+		parent : QObject reference, optional
+		  The parent object.
+
+		Returns
+		-------
+		FrameBudgetGovernor object
+			A running governor with no registered bars.
+
+		"""
+		super(FrameBudgetGovernor, self).__init__(parent)
+
+		self._budget = budget_ms / 1000.0
+		self._level = DEGRADATION_NONE
+		self._bars = {}            # bar -> render mode at registration
+		self._pending = {}         # bar -> [value or None, delta]
+
+		self._frame = 0
+		self._frame_cost = 0.0     # moving average, seconds
+		self._paint_time = 0.0     # paint time reported since the last frame
+		self._flush_time = 0.0     # time the last flush took
+		self._over = 0
+		self._under = 0
+
+		self._timer = QtCore.QTimer(self)
+		self._timer.setInterval(frame_interval_ms)
+		self._timer.timeout.connect(self._tick)
+		self._timer.start()
+
+	def _record_paint(self, seconds):
+		self._paint_time += seconds
+
+	def _in_focus(self, bar):
+		return(bar.isVisible() and bar.window().isActiveWindow() and not bar.visibleRegion().isEmpty())
+
+	def _tick(self):
+		self._frame += 1
+
+		cost = self._paint_time + self._flush_time
+		self._paint_time = 0.0
+		self._flush_time = 0.0
+		self._frame_cost += SMOOTHING * (cost - self._frame_cost)
+		self._adjust_level()
+
+		if self._pending and self._frame % FRAME_STRIDES[self._level] == 0:
+			started = time.perf_counter()
+			self._flush()
+			self._flush_time = time.perf_counter() - started
+
+	def _adjust_level(self):
+		if self._frame_cost > self._budget:
+			self._over += 1
+			self._under = 0
+			if self._over >= ESCALATE_AFTER_FRAMES and self._level < DEGRADATION_FOCUS_ONLY:
+				self._set_level(self._level + 1)
+		elif self._frame_cost < self._budget * RECOVER_RATIO:
+			self._under += 1
+			self._over = 0
+			if self._under >= RECOVER_AFTER_FRAMES and self._level > DEGRADATION_NONE:
+				self._set_level(self._level - 1)
+		else:
+			self._over = 0
+			self._under = 0
+
+	def _set_level(self, level):
+		previous = self._level
+		self._level = level
+		self._over = 0
+		self._under = 0
+
+		if level >= DEGRADATION_SOLID_FILL > previous:
+			for bar in list(self._bars):
+				try:
+					self._apply_solid_fill(bar)
+				except RuntimeError:  # The underlying C++ widget has been deleted
+					self._forget(bar)
+		elif previous >= DEGRADATION_SOLID_FILL > level:
+			for bar, render_mode in list(self._bars.items()):
+				if hasattr(bar, 'setRenderMode'):
+					try:
+						bar.setRenderMode(render_mode)
+					except RuntimeError:
+						self._forget(bar)
+
+		self.degradationLevelChanged.emit(level)
+
+	def _apply_solid_fill(self, bar):
+		if hasattr(bar, 'setRenderMode') and bar.getRenderMode() != pqtpbar.RENDER_MODE_SNAPPED:
+			bar.setRenderMode(pqtpbar.RENDER_MODE_SNAPPED)
+
+	def _forget(self, bar):
+		# Bars deleted without unregister() are dropped rather than raising in _tick()
+		self._bars.pop(bar, None)
+		self._pending.pop(bar, None)
+
+	def _flush(self):
+		focus_only = self._level >= DEGRADATION_FOCUS_ONLY
+		pending = self._pending
+		self._pending = {}
+		for bar, (value, delta) in pending.items():
+			try:
+				if focus_only and not self._in_focus(bar):
+					self._pending[bar] = [value, delta]
+					continue
+				if value is not None:
+					bar.setValue(value)
+				if delta:
+					bar.updateProgress(delta)
+			except RuntimeError:  # The underlying C++ widget has been deleted
+				self._forget(bar)
+
+	# -------------------------------------------------------------------------
+	# Public API
+	# -------------------------------------------------------------------------
+
+	def register(self, bar):
+		"""Puts a bar under the governor. Its paint time is measured, if it
+		supports that, and its render mode is managed while degraded.
+
+		Parameters
+		----------
+		bar : PyQtLineEditProgressBar
+		  The bar to govern. Any object with the progress API can be used, but
+		  only PyQtLineEditProgressBar reports its paint time and switches
+		  render modes.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		if bar in self._bars:
+			return
+		self._bars[bar] = bar.getRenderMode() if hasattr(bar, 'getRenderMode') else None
+		if hasattr(bar, '_paint_observer'):
+			bar._paint_observer = self._record_paint
+		if self._level >= DEGRADATION_SOLID_FILL:
+			self._apply_solid_fill(bar)
+
+	def unregister(self, bar):
+		"""Releases a bar from the governor, applying any updates held for it
+		and restoring its render mode."""
+		render_mode = self._bars.pop(bar, None)
+		pending = self._pending.pop(bar, None)
+		if hasattr(bar, '_paint_observer'):
+			bar._paint_observer = None
+		try:
+			if render_mode is not None:
+				bar.setRenderMode(render_mode)
+			if pending is not None:
+				value, delta = pending
+				if value is not None:
+					bar.setValue(value)
+				if delta:
+					bar.updateProgress(delta)
+		except RuntimeError:  # The underlying C++ widget has been deleted
+			pass
+
+	def updateProgress(self, bar, delta_float):
+		"""Queues an incremental update for a bar, applied at the next frame
+		the current degradation level allows. Updates queued between frames
+		are coalesced into one."""
+		pending = self._pending.get(bar)
+		if pending is None:
+			self._pending[bar] = [None, delta_float]
+		else:
+			pending[1] += delta_float
+
+	def setValue(self, bar, value_float):
+		"""Queues setting a bar's value, replacing any update still queued for it."""
+		self._pending[bar] = [value_float, 0.0]
+
+	def degradationLevel(self):
+		"""Returns the current degradation level, one of **DEGRADATION_LEVELS**."""
+		return(self._level)
+
+	def setDegradationLevel(self, level):
+		"""Forces a degradation level, from which the governor continues to adapt."""
+		level = min(max(int(level), DEGRADATION_NONE), DEGRADATION_FOCUS_ONLY)
+		if level != self._level:
+			self._set_level(level)
+
+	def frameCost(self):
+		"""Returns the moving average of the milliseconds spent on progress rendering per frame."""
+		return(1000.0 * self._frame_cost)
+
+	def budget(self):
+		"""Returns the per frame budget in milliseconds."""
+		return(1000.0 * self._budget)
+
+	def setBudget(self, budget_ms):
+		"""Sets the per frame budget in milliseconds."""
+		self._budget = budget_ms / 1000.0
+
+	def stop(self):
+		"""Stops the governor, restoring full fidelity and applying every held update."""
+		self._timer.stop()
+		for bar in list(self._bars):
+			self.unregister(bar)
+		self._level = DEGRADATION_NONE
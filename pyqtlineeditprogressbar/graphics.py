@@ -0,0 +1,236 @@
+"""
+.. module:: pyqtlineeditprogressbar.graphics
+
+**ProgressGraphicsItem**
+
+A line edit style progress bar for QGraphicsScene, without a proxy widget.
+
+Embedding PyQtLineEditProgressBar widgets in a scene through QGraphicsProxyWidget
+is very slow once a scene holds thousands of them. ProgressGraphicsItem is a
+QGraphicsObject that draws the same progressbar, using the same gradient and
+BEHAVIOR_MAP semantics as PyQtLineEditProgressBar's palette render mode, along
+with its text and frame.
+
+Its bounding rect never changes on update, so the scene's BSP index is left
+alone, and an update only invalidates the strip of the item between the old and
+new fill edge. By default the item is rendered through a
+**DeviceCoordinateCache**, so unchanged items are blitted from the cache rather
+than repainted when the view scrolls or other items change::
+
+    scene = QtWidgets.QGraphicsScene()
+    item = ProgressGraphicsItem('build', width=120, height=20)
+    item.setPos(node.pos())
+    scene.addItem(item)
+    item.updateProgress(0.1)
+
+"""
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import pyqtlineeditprogressbar as pqtpbar
+from pyqtlineeditprogressbar.display import TEXT_MARGIN
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+DEFAULT_WIDTH = 120
+DEFAULT_HEIGHT = 20
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+class ProgressGraphicsItem(QtWidgets.QGraphicsObject):
+
+	def __init__(self, contents='', width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT,
+				progressbar_color=pqtpbar.EMBEDDED_COLORS[pqtpbar.DECN[0]],
+				behavior=pqtpbar.DEFAULT_BEHAVIOR,
+				cache_mode=QtWidgets.QGraphicsItem.DeviceCoordinateCache,
+				parent=None,
+				):
+		"""Constructor for the ProgressGraphicsItem Class
+
+		Parameters
+		----------
+		contents : str, optional
+		  Text displayed over the progressbar.
+
+		width : float, optional
+		  The width of the item in item coordinates.
+
+		height : float, optional
+		  The height of the item in item coordinates.
+
+		progressbar_color : str, optional
+		  The progressbar color, validated exactly as in the PyQtLineEditProgressBar constructor.
+
+		behavior : str, optional
+		  One of the four **pyqtlineeditprogressbar.BEHAVIORS**, as in the
+		  PyQtLineEditProgressBar constructor.
+
+		cache_mode : QGraphicsItem.CacheMode, optional
+		  The item's cache mode. **DeviceCoordinateCache**, the default, suits
+		  items that are not transformed; use **ItemCoordinateCache** for items
+		  that are scaled or rotated, or **NoCache** to paint every time.
+
+		parent : QGraphicsItem reference, optional
+		  The parent item.
+
+		Returns
+		-------
+		ProgressGraphicsItem object
+			An initialized ProgressGraphicsItem object.
+
+		"""
+		super(ProgressGraphicsItem, self).__init__(parent)
+
+		self._rect = QtCore.QRectF(0, 0, width, height)
+		self._progressbar_shown = True
+		self._brush = None
+		self._font = QtWidgets.QApplication.font()
+
+		self._static_text = QtGui.QStaticText(contents)
+		self._static_text.setTextFormat(QtCore.Qt.PlainText)
+		self._static_text.setPerformanceHint(QtGui.QStaticText.AggressiveCaching)
+		self._static_text.prepare(QtGui.QTransform(), self._font)
+
+		self.setCacheMode(cache_mode)
+		self.setProgressBarColor(progressbar_color)
+		self.setProgressBarBehavior(behavior)
+
+	def _invalidate_fill(self, old_value):
+		# Only the strip between the old and new fill edges needs repainting,
+		# which also limits how much of the item's cache is re-rendered.
+		self._brush = None
+		rect = self._rect
+		old_edge = rect.x() + old_value * rect.width()
+		new_edge = rect.x() + self._value * rect.width()
+		left = min(old_edge, new_edge) - 1.0
+		self.update(QtCore.QRectF(left, rect.y(), abs(new_edge - old_edge) + 2.0, rect.height()))
+
+	def _set_value(self, value):
+		old_value = self._value
+		self._value = value
+		if not self._progressbar_shown:
+			self._progressbar_shown = True
+			self._brush = None
+			self.update()
+		elif value != old_value:
+			self._invalidate_fill(old_value)
+
+	# -------------------------------------------------------------------------
+	# QGraphicsItem Methods that are over-ridden
+	# -------------------------------------------------------------------------
+
+	def boundingRect(self):
+		return(self._rect)
+
+	def paint(self, painter, option, widget=None):
+		"""Paints the background, progressbar, text and frame of the item."""
+		rect = self._rect
+		painter.fillRect(rect, QtCore.Qt.white)
+
+		if self._progressbar_shown:
+			if self._brush is None:
+				gradient = pqtpbar._progress_gradient(rect, self._value, self._param_1, self._param_3, self._color)
+				self._brush = QtGui.QBrush(gradient)
+			painter.fillRect(rect, self._brush)
+
+		position = pqtpbar._text_position(rect, self._static_text.size(), QtCore.Qt.AlignLeft, TEXT_MARGIN)
+		painter.setFont(self._font)
+		painter.setPen(QtCore.Qt.black)
+		painter.drawStaticText(position, self._static_text)
+
+		painter.setPen(QtCore.Qt.gray)
+		painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+	# -------------------------------------------------------------------------
+	# Public API
+	# -------------------------------------------------------------------------
+
+	def setSize(self, width, height):
+		"""Resizes the item, in item coordinates."""
+		self.prepareGeometryChange()
+		self._rect = QtCore.QRectF(0, 0, width, height)
+		self._brush = None
+
+	def setText(self, text):
+		"""Sets the text displayed over the progressbar."""
+		if text == self._static_text.text():
+			return
+		self._static_text.setText(text)
+		self._static_text.prepare(QtGui.QTransform(), self._font)
+		self.update()
+
+	def text(self):
+		"""Returns the text displayed over the progressbar."""
+		return(self._static_text.text())
+
+	def setFont(self, font):
+		"""Sets the font of the text, the application font by default."""
+		self._font = QtGui.QFont(font)
+		self._static_text.prepare(QtGui.QTransform(), self._font)
+		self.update()
+
+	def updateProgress(self, delta_float):
+		"""Updates the progressbar incrementally, exactly as
+		**PyQtLineEditProgressBar.updateProgress()** does.
+
+		Parameters
+		----------
+		delta_float : float
+		  A float that must be between 0.0 and 1.0. Represents the incremental
+		  progress of the progress bar for a single progress bar update cycle.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		self._set_value(pqtpbar._advance_value(self._value, self._progressbar_behavior, self._delta_sign, delta_float))
+
+	def setValue(self, value_float):
+		"""Sets the current value of the progressbar, clamped to [0.001, 0.999]."""
+		self._set_value(min(max(value_float, 0.001), 0.999))
+
+	def setProgressFraction(self, fraction):
+		"""Sets the progressbar from the fraction of work completed, taking the
+		configured behavior into account."""
+		self._set_value(pqtpbar._fraction_to_value(fraction, self._progressbar_behavior))
+
+	def removeProgressBar(self):
+		"""Removes the progressbar until the next update."""
+		self._progressbar_shown = False
+		self.update()
+
+	def setProgressBarColor(self, color_text):
+		"""Sets the progressbar color, falling back to
+		**pyqtlineeditprogressbar.DEFAULT_COLOR_GREEN** if **color_text** is invalid."""
+		self._color = pqtpbar._validate_color(color_text)
+		self._brush = None
+		self.update()
+
+	def getProgressBarColor(self):
+		"""Returns the color value associated with the progressbar."""
+		return(self._color)
+
+	def setProgressBarBehavior(self, behavior):
+		"""Sets one of the four **pyqtlineeditprogressbar.BEHAVIORS** and resets
+		the value to its initial state, falling back to
+		**pyqtlineeditprogressbar.DEFAULT_BEHAVIOR** if **behavior** is invalid."""
+		self._progressbar_behavior = pqtpbar._validate_behavior(behavior)
+		self._value, self._param_1, self._param_3, self._delta_sign = pqtpbar.BEHAVIOR_MAP[self._progressbar_behavior]
+		self._brush = None
+		self.update()
+
+	def getBehavior(self):
+		"""Returns how the progressbar is configured to behave."""
+		return(self._progressbar_behavior)
+
+	def getValue(self):
+		"""Returns the current value of the progressbar, between 0.0 and 1.0."""
+		return(self._value)
@@ -0,0 +1,347 @@
+"""
+.. module:: pyqtlineeditprogressbar.panel
+
+**ProgressPanel**
+
+A single widget that paints a column of line edit style progress bars.
+
+A column of 200 PyQtLineEditProgressBar widgets in a QVBoxLayout means 200
+widgets to lay out, 200 palettes and 200 paint events per frame. A ProgressPanel
+holds N rows with the same four behaviors, colors and text, computes the row
+geometry itself and paints every row in one paintEvent(). An update repaints
+only the strip of the row whose fill edge moved, and paintEvent() only visits
+the rows that intersect the area being repainted.
+
+The per row API mirrors the PyQtLineEditProgressBar API, with the row index as
+the first parameter::
+
+    panel = ProgressPanel()
+    row = panel.addBar('job 1', behavior=pqtpbar.STARTS_EMPTY_FILLS_RIGHT_TO_LEFT)
+    panel.updateProgress(row, 0.1)
+
+"""
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import pyqtlineeditprogressbar as pqtpbar
+from pyqtlineeditprogressbar.display import FRAME_WIDTH, TEXT_MARGIN
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+DEFAULT_SPACING = 2
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+class _PanelRow(object):
+	__slots__ = ('static_text', 'color', 'behavior', 'value', 'param_1', 'delta_sign',
+				'shown', 'snapped_edge')
+
+	def __init__(self):
+		self.static_text = QtGui.QStaticText()
+		self.static_text.setTextFormat(QtCore.Qt.PlainText)
+		self.static_text.setPerformanceHint(QtGui.QStaticText.AggressiveCaching)
+		self.shown = True
+		self.snapped_edge = None
+
+
+class ProgressPanel(QtWidgets.QWidget):
+
+	def __init__(self, count=0, parent=None,
+				progressbar_color=pqtpbar.EMBEDDED_COLORS[pqtpbar.DECN[0]],
+				behavior=pqtpbar.DEFAULT_BEHAVIOR,
+				row_height=None,
+				spacing=DEFAULT_SPACING,
+				):
+		"""Constructor for the ProgressPanel Class
+
+		Parameters
+		----------
+		count : int, optional
+		  The number of rows to start with, all with **progressbar_color** and
+		  **behavior** and no text. More rows can be added with addBar().
+
+		parent : widget reference, optional
+		  The parent widget.
+
+		progressbar_color : str, optional
+		  The color of the initial rows, validated exactly as in the PyQtLineEditProgressBar constructor.
+
+		behavior : str, optional
+		  The behavior of the initial rows, one of the four **pyqtlineeditprogressbar.BEHAVIORS**.
+
+		row_height : int, optional
+		  The height of each row in pixels. If not specified, it is the height of
+		  the font plus the frame and text margins, like a line edit.
+
+		spacing : int, optional
+		  The gap between rows in pixels.
+
+		Returns
+		-------
+		ProgressPanel object
+			An initialized ProgressPanel object.
+
+		"""
+		super(ProgressPanel, self).__init__(parent=parent)
+
+		self._rows = []
+		self._row_height = row_height
+		self._spacing = spacing
+		self._alignment = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+
+		# Everything is painted in paintEvent(), so Qt need not erase first
+		self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent)
+		self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+
+		for _ in range(count):
+			self.addBar(progressbar_color=progressbar_color, behavior=behavior)
+
+	# -------------------------------------------------------------------------
+	# Row geometry
+	# -------------------------------------------------------------------------
+
+	def _pitch(self):
+		return(self.rowHeight() + self._spacing)
+
+	def rowHeight(self):
+		"""Returns the height of each row in pixels."""
+		if self._row_height:
+			return(self._row_height)
+		return(self.fontMetrics().height() + 2 * (FRAME_WIDTH + TEXT_MARGIN))
+
+	def rowRect(self, row):
+		"""Returns the QRect a row occupies within the panel."""
+		return(QtCore.QRect(0, self._spacing + row * self._pitch(), self.width(), self.rowHeight()))
+
+	def rowAt(self, y):
+		"""Returns the row at the y coordinate **y**, or -1 if there is none."""
+		row = (y - self._spacing) // self._pitch()
+		if 0 <= row < len(self._rows) and y < self.rowRect(row).bottom() + 1:
+			return(row)
+		return(-1)
+
+	def _inner_rect(self, row):
+		return(self.rowRect(row).adjusted(FRAME_WIDTH, FRAME_WIDTH, -FRAME_WIDTH, -FRAME_WIDTH))
+
+	def _update_row(self, row):
+		# Repaint only the strip between the old and new fill edges of the row
+		entry = self._rows[row]
+		if not entry.shown:
+			entry.shown = True
+			entry.snapped_edge = None
+
+		ratio = self.devicePixelRatioF()
+		edge = pqtpbar._snapped_fill_edge(self._inner_rect(row), entry.value, ratio)
+		strip = pqtpbar._snapped_repaint_rect(self.rowRect(row), entry.snapped_edge, edge, ratio)
+		if strip is not None:
+			entry.snapped_edge = edge
+			self.update(strip)
+
+	# -------------------------------------------------------------------------
+	# QWidget Methods that are over-ridden
+	# -------------------------------------------------------------------------
+
+	def paintEvent(self, event):
+		"""Paints every row that intersects the area being repainted."""
+		palette = self.palette()
+		exposed = event.rect()
+		ratio = self.devicePixelRatioF()
+
+		painter = QtGui.QPainter(self)
+		painter.fillRect(exposed, palette.color(QtGui.QPalette.Window))
+
+		base = palette.color(QtGui.QPalette.Base)
+		text_pen = palette.color(QtGui.QPalette.Text)
+		frame_pen = palette.color(QtGui.QPalette.Mid)
+
+		first = max(0, (exposed.top() - self._spacing) // self._pitch())
+		last = min(len(self._rows) - 1, exposed.bottom() // self._pitch())
+		for row in range(first, last + 1):
+			entry = self._rows[row]
+			rect = self.rowRect(row)
+			inner = rect.adjusted(FRAME_WIDTH, FRAME_WIDTH, -FRAME_WIDTH, -FRAME_WIDTH)
+
+			painter.fillRect(rect, base)
+			if entry.shown:
+				entry.snapped_edge = pqtpbar._snapped_fill_edge(inner, entry.value, ratio)
+				fill = pqtpbar._progress_fill_rect(inner, entry.snapped_edge / ratio, entry.param_1)
+				painter.fillRect(fill, QtGui.QColor(entry.color))
+
+			position = pqtpbar._text_position(inner, entry.static_text.size(), self._alignment, TEXT_MARGIN)
+			painter.setPen(text_pen)
+			painter.drawStaticText(position, entry.static_text)
+
+			painter.setPen(frame_pen)
+			painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+		painter.end()
+
+	def resizeEvent(self, event):
+		# Fill edges depend on the width, so every row repaints in full
+		for entry in self._rows:
+			entry.snapped_edge = None
+		super(ProgressPanel, self).resizeEvent(event)
+
+	def changeEvent(self, event):
+		"""Re-prepares the cached text of every row when the font changes."""
+		super(ProgressPanel, self).changeEvent(event)
+		if event.type() == QtCore.QEvent.FontChange:
+			for entry in self._rows:
+				entry.static_text.prepare(QtGui.QTransform(), self.font())
+			self.updateGeometry()
+			self.update()
+
+	def sizeHint(self):
+		"""Returns a size that fits every row, with the width of a line edit."""
+		metrics = self.fontMetrics()
+		width = metrics.horizontalAdvance('x') * 17 + 2 * (FRAME_WIDTH + TEXT_MARGIN)
+		for entry in self._rows:
+			width = max(width, int(entry.static_text.size().width()) + 2 * (FRAME_WIDTH + TEXT_MARGIN))
+		return(QtCore.QSize(width, self._spacing + len(self._rows) * self._pitch()))
+
+	def minimumSizeHint(self):
+		return(QtCore.QSize(self.fontMetrics().maxWidth(), self.sizeHint().height()))
+
+	# -------------------------------------------------------------------------
+	# Public API
+	# -------------------------------------------------------------------------
+
+	def addBar(self, contents='',
+				progressbar_color=pqtpbar.EMBEDDED_COLORS[pqtpbar.DECN[0]],
+				behavior=pqtpbar.DEFAULT_BEHAVIOR,
+				):
+		"""Appends a row to the panel.
+
+		Parameters
+		----------
+		contents : str, optional
+		  Text displayed over the row's progressbar.
+
+		progressbar_color : str, optional
+		  The row's color, validated exactly as in the PyQtLineEditProgressBar constructor.
+
+		behavior : str, optional
+		  The row's behavior, one of the four **pyqtlineeditprogressbar.BEHAVIORS**.
+
+		Returns
+		-------
+		int
+		  The index of the new row.
+		"""
+		entry = _PanelRow()
+		self._rows.append(entry)
+		row = len(self._rows) - 1
+
+		entry.static_text.setText(contents)
+		entry.static_text.prepare(QtGui.QTransform(), self.font())
+		entry.color = pqtpbar._validate_color(progressbar_color)
+		self._set_behavior(entry, behavior)
+
+		self.updateGeometry()
+		self.update(self.rowRect(row))
+		return(row)
+
+	def count(self):
+		"""Returns the number of rows."""
+		return(len(self._rows))
+
+	def __len__(self):
+		return(len(self._rows))
+
+	def setText(self, row, text):
+		"""Sets the text displayed over a row's progressbar."""
+		entry = self._rows[row]
+		if text == entry.static_text.text():
+			return
+		entry.static_text.setText(text)
+		entry.static_text.prepare(QtGui.QTransform(), self.font())
+		self.update(self.rowRect(row))
+
+	def text(self, row):
+		"""Returns the text displayed over a row's progressbar."""
+		return(self._rows[row].static_text.text())
+
+	def setAlignment(self, alignment):
+		"""Sets the horizontal alignment of the text of every row."""
+		self._alignment = alignment
+		self.update()
+
+	def alignment(self):
+		"""Returns the alignment of the text."""
+		return(self._alignment)
+
+	def updateProgress(self, row, delta_float):
+		"""Updates a row incrementally, exactly as **PyQtLineEditProgressBar.updateProgress()** does.
+
+		Parameters
+		----------
+		row : int
+		  The row to update.
+
+		delta_float : float
+		  A float that must be between 0.0 and 1.0. Represents the incremental
+		  progress of the row for a single progress bar update cycle.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		entry = self._rows[row]
+		entry.value = pqtpbar._advance_value(entry.value, entry.behavior, entry.delta_sign, delta_float)
+		self._update_row(row)
+
+	def setValue(self, row, value_float):
+		"""Sets the current value of a row, clamped to [0.001, 0.999]."""
+		self._rows[row].value = min(max(value_float, 0.001), 0.999)
+		self._update_row(row)
+
+	def setProgressFraction(self, row, fraction):
+		"""Sets a row from the fraction of work completed, taking its behavior into account."""
+		entry = self._rows[row]
+		entry.value = pqtpbar._fraction_to_value(fraction, entry.behavior)
+		self._update_row(row)
+
+	def removeProgressBar(self, row):
+		"""Removes a row's progressbar until its next update."""
+		entry = self._rows[row]
+		entry.shown = False
+		entry.snapped_edge = None
+		self.update(self.rowRect(row))
+
+	def setProgressBarColor(self, row, color_text):
+		"""Sets a row's color, falling back to
+		**pyqtlineeditprogressbar.DEFAULT_COLOR_GREEN** if **color_text** is invalid."""
+		self._rows[row].color = pqtpbar._validate_color(color_text)
+		self.update(self.rowRect(row))
+
+	def getProgressBarColor(self, row):
+		"""Returns the color value associated with a row."""
+		return(self._rows[row].color)
+
+	def _set_behavior(self, entry, behavior):
+		entry.behavior = pqtpbar._validate_behavior(behavior)
+		entry.value, entry.param_1, _, entry.delta_sign = pqtpbar.BEHAVIOR_MAP[entry.behavior]
+		entry.snapped_edge = None
+
+	def setProgressBarBehavior(self, row, behavior):
+		"""Sets a row to one of the four **pyqtlineeditprogressbar.BEHAVIORS** and
+		resets its value to the initial state, falling back to
+		**pyqtlineeditprogressbar.DEFAULT_BEHAVIOR** if **behavior** is invalid."""
+		self._set_behavior(self._rows[row], behavior)
+		self.update(self.rowRect(row))
+
+	def getBehavior(self, row):
+		"""Returns how a row is configured to behave."""
+		return(self._rows[row].behavior)
+
+	def getValue(self, row):
+		"""Returns the current value of a row, between 0.0 and 1.0."""
+		return(self._rows[row].value)
@@ -0,0 +1,249 @@
+"""
+.. module:: pyqtlineeditprogressbar.pool
+
+**ProgressBarPool**
+
+Recycles PyQtLineEditProgressBar widgets for virtualized and scrolling lists.
+
+Creating a PyQtLineEditProgressBar as a row scrolls into view, and deleting it
+as the row scrolls out, costs a QLineEdit construction, palette setup, color
+validation and an initial progressbar update each time, then a deletion. A
+ProgressBarPool keeps released bars and hands them out again, rebinding them to
+the new row's text, color, behavior and value, which only costs what actually
+changed::
+
+    pool = ProgressBarPool(max_size=100)
+
+    bar = pool.acquire('job 42', progressbar_color=pqtpbar.DEFAULT_COLOR_BLUE, value=0.25)
+    view.setIndexWidget(index, bar)
+    ...
+    pool.release(bar)
+
+    print(pool.hitRate())
+
+"""
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import sip
+
+import pyqtlineeditprogressbar as pqtpbar
+from pyqtlineeditprogressbar import PyQtLineEditProgressBar
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+DEFAULT_MAX_SIZE = 64
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+class ProgressBarPool(object):
+
+	def __init__(self, max_size=DEFAULT_MAX_SIZE, factory=PyQtLineEditProgressBar, prefill=0):
+		"""Constructor for the ProgressBarPool Class
+
+		Parameters
+		----------
+		max_size : int, optional
+		  The most released bars the pool keeps. Bars released into a full pool
+		  are deleted.
+
+		factory : callable, optional
+		  Called with no arguments to construct a bar when the pool is empty.
+		  Defaults to PyQtLineEditProgressBar; any class with the same API, such
+		  as PyQtDisplayProgressBar, or a function returning a configured bar
+		  (for example with a **render_mode**) can be used.
+
+		prefill : int, optional
+		  The number of bars to construct up front, capped at **max_size**.
+
+		Returns
+		-------
+		ProgressBarPool object
+			An initialized ProgressBarPool object.
+
+		"""
+		self._max_size = max_size
+		self._factory = factory
+		self._free = []
+
+		self._hits = 0
+		self._misses = 0
+		self._discarded = 0
+
+		self.prefill(prefill)
+
+	def _prune(self):
+		# Released bars keep their parent, so deleting the parent (for example
+		# the list's viewport) deletes them too. Their wrappers are dropped.
+		self._free = [bar for bar in self._free if not sip.isdeleted(bar)]
+
+	def prefill(self, count):
+		"""Constructs bars until the pool holds **count** free bars, capped at the maximum size."""
+		self._prune()
+		count = min(count, self._max_size)
+		while len(self._free) < count:
+			self._free.append(self._factory())
+
+	def acquire(self, contents='', parent=None,
+				progressbar_color=pqtpbar.EMBEDDED_COLORS[pqtpbar.DECN[0]],
+				behavior=pqtpbar.DEFAULT_BEHAVIOR,
+				value=None,
+				):
+		"""Returns a bar bound to the given state, recycled from the pool if one is free.
+
+		Parameters
+		----------
+		contents : str, optional
+		  The bar's text.
+
+		parent : widget reference, optional
+		  The bar's new parent. If not specified, the bar is left without a parent
+		  (if newly constructed) or with whatever parent it had when released.
+
+		progressbar_color : str, optional
+		  The bar's color, validated exactly as in the PyQtLineEditProgressBar constructor.
+
+		behavior : str, optional
+		  The bar's behavior, one of the four **pyqtlineeditprogressbar.BEHAVIORS**.
+
+		value : float, optional
+		  The bar's value. If not specified, the bar starts at the initial value
+		  of its behavior.
+
+		Returns
+		-------
+		PyQtLineEditProgressBar
+		  A bar in the requested state. It is shown if it has a parent, and
+		  otherwise left hidden until the caller places it; **setIndexWidget()**
+		  shows the widgets it is given, elsewhere call **show()**.
+		"""
+		bar = None
+		while self._free:
+			bar = self._free.pop()
+			if not sip.isdeleted(bar):
+				self._hits += 1
+				break
+			bar = None
+		if bar is None:
+			bar = self._factory()
+			self._misses += 1
+
+		if parent is not None and bar.parent() is not parent:
+			bar.setParent(parent)
+
+		# Each setter is only paid for if the state actually differs
+		if bar.text() != contents:
+			bar.setText(contents)
+		if bar.getProgressBarColor() != pqtpbar._validate_color(progressbar_color):
+			bar.setProgressBarColor(progressbar_color)
+		bar.setProgressBarBehavior(behavior)
+		if value is None:
+			bar.setValue(bar.getValue())
+		else:
+			bar.setValue(value)
+
+		# A bar without a parent would be shown as a top level window
+		if bar.parent() is not None:
+			bar.show()
+		return(bar)
+
+	def release(self, bar):
+		"""Returns a bar to the pool for reuse, hiding it. If the pool is full the
+		bar is deleted instead.
+
+		Parameters
+		----------
+		bar : PyQtLineEditProgressBar
+		  A bar previously returned by **acquire()**. It must no longer be used by
+		  the caller. The bar keeps its parent; if that parent is later deleted,
+		  **acquire()** skips the bar, counting a miss if no live bar is left.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		if sip.isdeleted(bar):
+			return
+
+		stop_timed_progress = getattr(bar, 'stopTimedProgress', None)
+		if stop_timed_progress is not None:
+			stop_timed_progress()
+
+		# Only a full pool is checked for bars deleted along with their parent
+		if len(self._free) >= self._max_size:
+			self._prune()
+		if len(self._free) >= self._max_size:
+			self._discarded += 1
+			bar.hide()
+			bar.deleteLater()
+			return
+
+		bar.hide()
+		self._free.append(bar)
+
+	def setMaxSize(self, max_size):
+		"""Sets the most released bars the pool keeps, deleting any excess free bars."""
+		self._max_size = max_size
+		self._prune()
+		while len(self._free) > max_size:
+			self._free.pop().deleteLater()
+			self._discarded += 1
+
+	def maxSize(self):
+		"""Returns the most released bars the pool keeps."""
+		return(self._max_size)
+
+	def freeCount(self):
+		"""Returns the number of free bars currently held by the pool. Bars
+		deleted along with their parent are counted until **acquire()** skips
+		them."""
+		return(len(self._free))
+
+	def clear(self):
+		"""Deletes every free bar held by the pool."""
+		self._prune()
+		while self._free:
+			self._free.pop().deleteLater()
+
+	def hitRate(self):
+		"""Returns the fraction of **acquire()** calls served from the pool, between
+		0.0 and 1.0, or 0.0 if nothing has been acquired yet."""
+		total = self._hits + self._misses
+		if total == 0:
+			return(0.0)
+		return(self._hits / float(total))
+
+	def statistics(self):
+		"""Returns a dict of the pool's statistics.
+
+		Parameters
+		----------
+		None
+		  Nothing
+
+		Returns
+		-------
+		dict
+		  **hits**, the acquires served from the pool; **misses**, the acquires
+		  that constructed a new bar; **discarded**, the bars deleted because the
+		  pool was full; **free**, the bars currently held; **max_size**; and
+		  **hit_rate**.
+		"""
+		return({
+			'hits': self._hits,
+			'misses': self._misses,
+			'discarded': self._discarded,
+			'free': self.freeCount(),
+			'max_size': self._max_size,
+			'hit_rate': self.hitRate(),
+		})
+
+	def resetStatistics(self):
+		"""Resets the hit, miss and discard counters to zero."""
+		self._hits = 0
+		self._misses = 0
+		self._discarded = 0
@@ -0,0 +1,381 @@
+"""
+.. module:: pyqtlineeditprogressbar.recorder
+
+**ProgressRecorder** and **ProgressReplayer**
+
+Record and replay the progress event streams that drive progress bars.
+
+Performance problems often depend on the exact timing and fan-out of progress
+events. A ProgressRecorder attached to a set of bars logs every progress, value,
+color and behavior call they receive, with monotonic timestamps, to a compact
+line-delimited trace. A ProgressReplayer later drives a set of headless bars
+from that trace, in real time or accelerated, and collects per frame timings,
+so a trace from production can be attached to a performance bug report and
+reproduced anywhere::
+
+    with ProgressRecorder('progress.trace') as recorder:
+        for bar in bars:
+            recorder.attach(bar)
+        app.exec_()
+
+    timings = ProgressReplayer('progress.trace', speed=10.0).run()
+    print(timings['mean_frame_ms'], timings['max_frame_ms'])
+
+Or from the command line::
+
+    python -m pyqtlineeditprogressbar.recorder progress.trace --speed 10
+
+Trace format
+------------
+The first line is a header. Every following line is one call, as four tab
+separated fields: the nanoseconds since recording started, the bar id, a one
+letter operation code and the call's argument::
+
+    # pyqtlineeditprogressbar trace 1
+    1520300	0	u	0.1
+
+The operation codes are **u** updateProgress, **v** setValue, **f**
+setProgressFraction, **c** setProgressBarColor, **b** setProgressBarBehavior
+and **r** removeProgressBar. Attaching a bar records its color, behavior and
+value at that moment, so replay starts from the same state.
+
+"""
+# ----------------------------------------------------------------------------
+# ------------------------ Python Standard Library ---------------------------
+# ----------------------------------------------------------------------------
+import argparse
+import time
+
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+from pyqtlineeditprogressbar import FRAME_INTERVAL_MS
+from pyqtlineeditprogressbar import PyQtLineEditProgressBar
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+TRACE_HEADER = '# pyqtlineeditprogressbar trace 1'
+
+# Operation code -> (method name, argument parser)
+OPERATIONS = {
+	'u': ('updateProgress', float),
+	'v': ('setValue', float),
+	'f': ('setProgressFraction', float),
+	'c': ('setProgressBarColor', str),
+	'b': ('setProgressBarBehavior', str),
+	'r': ('removeProgressBar', None),
+}
+
+DEFAULT_BAR_SIZE = QtCore.QSize(200, 24)
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+class ProgressRecorder(object):
+
+	def __init__(self, trace):
+		"""Constructor for the ProgressRecorder Class
+
+		Parameters
+		----------
+		trace : str or file object
+		  The path of the trace file to write, or a text file object open for
+		  writing. A path is opened (and truncated) here and closed by **close()**.
+
+		Returns
+		-------
+		ProgressRecorder object
+			A recorder with no attached bars.
+
+		"""
+		if isinstance(trace, str):
+			self._file = open(trace, 'w')
+			self._owns_file = True
+		else:
+			self._file = trace
+			self._owns_file = False
+		self._file.write(TRACE_HEADER + '\n')
+
+		self._started = time.monotonic_ns()
+		self._attached = {}
+		self._next_id = 0
+		self._depth = 0
+
+	def __enter__(self):
+		return(self)
+
+	def __exit__(self, *exc_info):
+		self.close()
+
+	def _write(self, bar_id, op, argument):
+		self._file.write('{}\t{}\t{}\t{}\n'.format(time.monotonic_ns() - self._started, bar_id, op, argument))
+
+	def _wrap(self, bar, bar_id, op, name):
+		method = getattr(bar, name)
+
+		def recorded(*args):
+			# Only the outermost call is recorded, so a setProgressFraction()
+			# that calls setValue() internally is one record, not two.
+			if self._depth == 0:
+				self._write(bar_id, op, args[0] if args else '')
+			self._depth += 1
+			try:
+				return(method(*args))
+			finally:
+				self._depth -= 1
+
+		setattr(bar, name, recorded)
+
+	def attach(self, bar, bar_id=None):
+		"""Starts recording the calls a bar receives.
+
+		Parameters
+		----------
+		bar : PyQtLineEditProgressBar
+		  The bar to record. Any object with the progress API can be recorded.
+
+		bar_id : str, optional
+		  The id the bar's records carry. It must not contain tabs or newlines.
+		  If not specified, bars are numbered in the order they are attached.
+
+		Returns
+		-------
+		str
+		  The bar's id.
+		"""
+		if bar_id is None:
+			bar_id = str(self._next_id)
+			self._next_id += 1
+		bar_id = str(bar_id)
+
+		# The starting state, so replay begins where the bar was
+		self._write(bar_id, 'c', bar.getProgressBarColor())
+		self._write(bar_id, 'b', bar.getBehavior())
+		self._write(bar_id, 'v', bar.getValue())
+
+		for op, (name, _) in OPERATIONS.items():
+			if hasattr(bar, name):
+				self._wrap(bar, bar_id, op, name)
+		self._attached[bar] = bar_id
+		return(bar_id)
+
+	def detach(self, bar):
+		"""Stops recording a bar, restoring its methods."""
+		if self._attached.pop(bar, None) is None:
+			return
+		for name, _ in OPERATIONS.values():
+			if name in bar.__dict__:
+				delattr(bar, name)
+
+	def flush(self):
+		"""Flushes buffered records to the trace."""
+		self._file.flush()
+
+	def close(self):
+		"""Detaches every bar and closes the trace, if the recorder opened it."""
+		for bar in list(self._attached):
+			self.detach(bar)
+		if self._owns_file:
+			self._file.close()
+		else:
+			self._file.flush()
+
+
+def read_trace(trace):
+	"""Reads a trace written by ProgressRecorder.
+
+	Parameters
+	----------
+	trace : str or file object
+	  The path of the trace file, or a text file object open for reading.
+
+	Returns
+	-------
+	list
+	  (nanoseconds, bar id, method name, argument) tuples, in recorded order.
+	  Blank lines are skipped, and so is a malformed last record, as left by a
+	  recorder that crashed or a trace that was cut short.
+
+	Raises
+	------
+	ValueError
+	  If the trace does not start with the expected header, or a record other
+	  than the last is malformed. The message names the line.
+	"""
+	if isinstance(trace, str):
+		with open(trace) as trace_file:
+			return(read_trace(trace_file))
+
+	if trace.readline().rstrip('\r\n') != TRACE_HEADER:
+		raise ValueError('Not a pyqtlineeditprogressbar trace')
+
+	records = []
+	malformed = None
+	for number, line in enumerate(trace, 2):
+		line = line.rstrip('\r\n')
+		if not line:
+			continue
+		if malformed is not None:
+			raise malformed
+		try:
+			timestamp, bar_id, op, argument = line.split('\t', 3)
+			name, parse = OPERATIONS[op]
+			records.append((int(timestamp), bar_id, name, parse(argument) if parse else None))
+		except (ValueError, KeyError):
+			# Only raised if more records follow, a truncated last record is skipped
+			malformed = ValueError('Malformed trace record on line {}: {!r}'.format(number, line))
+	return(records)
+
+
+class ProgressReplayer(object):
+
+	def __init__(self, trace, speed=1.0, factory=PyQtLineEditProgressBar,
+				frame_interval_ms=FRAME_INTERVAL_MS, bar_size=DEFAULT_BAR_SIZE):
+		"""Constructor for the ProgressReplayer Class
+
+		Parameters
+		----------
+		trace : str or file object
+		  The trace to replay, see **read_trace()**.
+
+		speed : float, optional
+		  How many times faster than recorded to replay. 1.0 replays in real
+		  time. 0 replays as fast as possible, one recorded frame interval of
+		  events per frame.
+
+		factory : callable, optional
+		  Called with no arguments to construct the bar for each bar id in the
+		  trace. Defaults to PyQtLineEditProgressBar.
+
+		frame_interval_ms : int, optional
+		  The interval between replay frames, in milliseconds.
+
+		bar_size : QSize, optional
+		  The size of the headless bars.
+
+		Returns
+		-------
+		ProgressReplayer object
+			A replayer ready to **run()**.
+
+		"""
+		self._records = read_trace(trace)
+		self._speed = speed
+		self._factory = factory
+		self._frame_interval = frame_interval_ms
+		self._bar_size = bar_size
+		self._bars = {}
+
+	def _bar(self, bar_id):
+		bar = self._bars.get(bar_id)
+		if bar is None:
+			bar = self._factory()
+			bar.resize(self._bar_size)
+			self._bars[bar_id] = bar
+		return(bar)
+
+	def bars(self):
+		"""Returns a dict of the headless bars created so far, keyed by bar id."""
+		return(dict(self._bars))
+
+	def run(self):
+		"""Replays the whole trace, blocking in a local event loop until done.
+
+		Each frame applies the records that are due and renders every bar they
+		touched into an offscreen image, so paint cost is part of the timing.
+
+		Parameters
+		----------
+		None
+		  Nothing
+
+		Returns
+		-------
+		dict
+		  **frames**, the number of frames; **records**, the number of records
+		  applied; **frame_ms**, the list of per frame milliseconds; and
+		  **mean_frame_ms**, **p95_frame_ms** and **max_frame_ms**.
+		"""
+		app = QtWidgets.QApplication.instance()
+		if app is None:
+			raise RuntimeError('ProgressReplayer.run() needs a QApplication')
+
+		image = QtGui.QImage(self._bar_size, QtGui.QImage.Format_ARGB32_Premultiplied)
+		frame_ms = []
+		state = {'next': 0, 'frame': 0, 'started': time.perf_counter()}
+		loop = QtCore.QEventLoop()
+
+		def frame():
+			if self._speed > 0:
+				due = (time.perf_counter() - state['started']) * self._speed * 1e9
+			else:
+				state['frame'] += 1
+				due = state['frame'] * self._frame_interval * 1e6
+
+			started = time.perf_counter()
+			touched = set()
+			index = state['next']
+			records = self._records
+			while index < len(records) and records[index][0] <= due:
+				_, bar_id, name, argument = records[index]
+				bar = self._bar(bar_id)
+				if argument is None:
+					getattr(bar, name)()
+				else:
+					getattr(bar, name)(argument)
+				touched.add(bar)
+				index += 1
+			state['next'] = index
+
+			for bar in touched:
+				bar.render(image)
+			if touched:
+				frame_ms.append(1000.0 * (time.perf_counter() - started))
+
+			if index >= len(records):
+				timer.stop()
+				loop.quit()
+
+		timer = QtCore.QTimer()
+		timer.setInterval(0 if self._speed <= 0 else self._frame_interval)
+		timer.timeout.connect(frame)
+		timer.start()
+		if self._records:
+			loop.exec_()
+		timer.stop()
+
+		ordered = sorted(frame_ms)
+		return({
+			'frames': len(frame_ms),
+			'records': state['next'],
+			'frame_ms': frame_ms,
+			'mean_frame_ms': sum(frame_ms) / len(frame_ms) if frame_ms else 0.0,
+			'p95_frame_ms': ordered[int(0.95 * (len(ordered) - 1))] if ordered else 0.0,
+			'max_frame_ms': ordered[-1] if ordered else 0.0,
+		})
+
+# ----------------------------------------------------------------------------
+def main():
+	parser = argparse.ArgumentParser(description='Replay a PyQtLineEditProgressBar trace')
+	parser.add_argument('trace', help='trace file written by ProgressRecorder')
+	parser.add_argument('--speed', type=float, default=1.0,
+						help='replay speed, 1 for real time, 0 for as fast as possible')
+	args = parser.parse_args()
+
+	app = QtWidgets.QApplication([])
+	timings = ProgressReplayer(args.trace, speed=args.speed).run()
+	print('{} records, {} frames'.format(timings['records'], timings['frames']))
+	print('frame ms: mean {:.3f}  p95 {:.3f}  max {:.3f}'.format(
+		timings['mean_frame_ms'], timings['p95_frame_ms'], timings['max_frame_ms']))
+
+# ----------------------------------------------------------------------------
+# ----------------------------- main -----------------------------------------
+# ----------------------------------------------------------------------------
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,287 @@
+"""
+.. module:: pyqtlineeditprogressbar.shared
+
+**SharedProgressTable**
+
+Cross-process progress reporting through shared memory.
+
+Piping every progress tick from **multiprocessing** or **ProcessPoolExecutor**
+workers back to the GUI through queues costs a pickle and an IPC round trip per
+tick. A SharedProgressTable is a block of shared memory holding, for each slot
+(job), the fraction of work completed and a sequence counter. Workers write
+their own slot directly, with no locks and no pickling. The GUI side polls the
+table once per frame with a SharedProgressPoller, which pushes only the slots
+whose sequence counter moved into their bound PyQtLineEditProgressBar widgets.
+
+Each slot must have a single writer. A writer makes the sequence counter odd
+while it stores the value and even again once it is done, so the poller never
+displays a value it caught half written; it just picks it up on the next frame.
+
+A table pickles as its shared memory name, so it can be passed to workers as
+an ordinary argument::
+
+    table = SharedProgressTable(size=len(jobs))
+    poller = SharedProgressPoller(table)
+    for slot, widget in enumerate(widgets):
+        poller.bind(slot, widget)
+    poller.start()
+
+    with concurrent.futures.ProcessPoolExecutor() as pool:
+        for slot, job in enumerate(jobs):
+            pool.submit(run_job, job, table, slot)
+
+    # in run_job(): table.setProgress(slot, done / total)
+
+"""
+# ----------------------------------------------------------------------------
+# ------------------------ Python Standard Library ---------------------------
+# ----------------------------------------------------------------------------
+import struct
+
+from multiprocessing import shared_memory
+
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import QtCore
+
+from pyqtlineeditprogressbar import FRAME_INTERVAL_MS
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+# Layout: a header holding the slot count, then one float64 value per slot,
+# then one uint64 sequence counter per slot. Everything is 8 byte aligned.
+_HEADER = struct.Struct('<Q')
+_ITEM_SIZE = 8
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+class SharedProgressTable(object):
+
+	def __init__(self, name=None, size=0):
+		"""Constructor for the SharedProgressTable Class
+
+		Parameters
+		----------
+		name : str, optional
+		  The name of the shared memory block. When creating a table it may be
+		  left out to have a unique name generated. When attaching to an existing
+		  table it is required.
+
+		size : int, optional
+		  The number of slots. A size greater than zero creates a new table,
+		  with every slot at 0.0. A size of zero attaches to the existing table
+		  called **name**, as a worker process does.
+
+		Returns
+		-------
+		SharedProgressTable object
+		  A table backed by the shared memory block.
+
+		"""
+		if size > 0:
+			nbytes = _HEADER.size + (2 * _ITEM_SIZE * size)
+			self._shm = shared_memory.SharedMemory(name=name, create=True, size=nbytes)
+			_HEADER.pack_into(self._shm.buf, 0, size)
+			self._owner = True
+		else:
+			self._shm = shared_memory.SharedMemory(name=name)
+			size = _HEADER.unpack_from(self._shm.buf, 0)[0]
+			self._owner = False
+
+		self._size = size
+		values_start = _HEADER.size
+		sequences_start = values_start + (_ITEM_SIZE * size)
+		self._views = [self._shm.buf[values_start:sequences_start],
+						self._shm.buf[sequences_start:sequences_start + (_ITEM_SIZE * size)]]
+		self._values = self._views[0].cast('d')
+		self._sequences = self._views[1].cast('Q')
+
+	def __len__(self):
+		return(self._size)
+
+	def __del__(self):
+		self.close()
+
+	def __reduce__(self):
+		# Workers attach to the same block by name rather than copying it
+		return(SharedProgressTable, (self.name,))
+
+	@property
+	def name(self):
+		"""The name of the shared memory block, used to attach to the table."""
+		return(self._shm.name)
+
+	def setProgress(self, slot, fraction):
+		"""Writes the fraction of work completed for a slot. Called by the
+		single worker that owns **slot**; no locks are taken.
+
+		Parameters
+		----------
+		slot : int
+		  The slot to write.
+
+		fraction : float
+		  The fraction of work completed, between 0.0 and 1.0.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		sequence = self._sequences[slot]
+		self._sequences[slot] = sequence + 1   # odd, write in progress
+		self._values[slot] = fraction
+		self._sequences[slot] = sequence + 2   # even, write complete
+
+	def getProgress(self, slot):
+		"""Returns the last fraction of work completed written to a slot."""
+		return(self._values[slot])
+
+	def getSequence(self, slot):
+		"""Returns a slot's sequence counter, which is odd while a write is in progress."""
+		return(self._sequences[slot])
+
+	def readChanged(self, last_sequences, slots):
+		"""Finds the slots in **slots** whose sequence counter differs from
+		**last_sequences**, reading each one's value consistently.
+
+		Parameters
+		----------
+		last_sequences : dict
+		  The sequence counter last seen for each slot.
+
+		slots : iterable of int
+		  The slots to check.
+
+		Returns
+		-------
+		tuple
+		  A list of (slot, fraction, sequence) tuples for the changed slots, and
+		  a bool that is False if any slot was skipped because a write to it was
+		  in progress. Skipped slots are picked up by the next call.
+		"""
+		sequences = self._sequences.tolist()
+		values = self._values
+		changed = []
+		complete = True
+		for slot in slots:
+			sequence = sequences[slot]
+			if sequence == last_sequences.get(slot):
+				continue
+			if sequence & 1:
+				complete = False
+				continue
+			fraction = values[slot]
+			if self._sequences[slot] != sequence:
+				complete = False
+				continue
+			changed.append((slot, fraction, sequence))
+		return(changed, complete)
+
+	def sequenceSnapshot(self):
+		"""Returns the sequence counters of every slot as bytes, which is a cheap
+		way to tell whether anything at all changed since the last snapshot."""
+		return(self._sequences.tobytes())
+
+	def close(self):
+		"""Detaches this process from the table."""
+		if getattr(self, '_shm', None) is None:
+			return
+		# Every view into the block must be released before it can be closed
+		self._values.release()
+		self._sequences.release()
+		for view in self._views:
+			view.release()
+		self._shm.close()
+		self._shm = None
+
+	def unlink(self):
+		"""Detaches from the table and, if this process created it, frees the
+		shared memory block. Call once, from the creating process, when done."""
+		shm = self._shm
+		self.close()
+		if shm is not None and self._owner:
+			shm.unlink()
+
+
+class SharedProgressPoller(QtCore.QObject):
+
+	def __init__(self, table, interval_ms=FRAME_INTERVAL_MS, parent=None):
+		"""Constructor for the SharedProgressPoller Class
+
+		Parameters
+		----------
+		table : SharedProgressTable
+		  The table to poll.
+
+		interval_ms : int, optional
+		  How often, in milliseconds, **poll()** runs once **start()** is called.
+
+		parent : QObject reference, optional
+		  The parent object.
+
+		Returns
+		-------
+		SharedProgressPoller object
+		  A poller with no bound widgets.
+
+		"""
+		super(SharedProgressPoller, self).__init__(parent)
+		self._table = table
+		self._bound = {}
+		self._last_sequences = {}
+		self._last_snapshot = None
+
+		self._timer = QtCore.QTimer(self)
+		self._timer.setInterval(interval_ms)
+		self._timer.timeout.connect(self.poll)
+
+	def bind(self, slot, widget):
+		"""Binds a PyQtLineEditProgressBar widget to a table slot. The widget
+		is updated with **setProgressFraction()** whenever the slot changes."""
+		self._bound[slot] = widget
+		self._last_sequences.pop(slot, None)
+		self._last_snapshot = None
+
+	def unbind(self, slot):
+		"""Removes the widget bound to **slot**, if any."""
+		self._bound.pop(slot, None)
+		self._last_sequences.pop(slot, None)
+
+	def start(self):
+		"""Starts polling on the GUI thread's event loop."""
+		self._timer.start()
+
+	def stop(self):
+		"""Stops polling."""
+		self._timer.stop()
+
+	def poll(self):
+		"""Pushes every bound slot that changed since the last poll into its widget.
+
+		Parameters
+		----------
+		None
+		  Nothing
+
+		Returns
+		-------
+		int
+		  The number of widgets updated.
+		"""
+		snapshot = self._table.sequenceSnapshot()
+		if snapshot == self._last_snapshot:
+			return(0)
+
+		changed, complete = self._table.readChanged(self._last_sequences, self._bound)
+		for slot, fraction, sequence in changed:
+			self._bound[slot].setProgressFraction(fraction)
+			self._last_sequences[slot] = sequence
+
+		# A slot skipped mid-write must be read again even if nothing else moves
+		self._last_snapshot = snapshot if complete else None
+		return(len(changed))
@@ -0,0 +1,324 @@
+"""
+.. module:: pyqtlineeditprogressbar.soak
+
+**Soak Test**
+
+A headless memory and leak soak test for long running applications.
+
+Dashboards run for weeks, creating, updating and destroying bars millions of
+times, so anything that grows per update, such as gradients, brushes and
+palettes that are never released, or a cache without a bound, eventually
+exhausts memory. The soak test runs rounds of bulk work: it creates bars in all
+render modes, updates, recolors (with both named and ever new colors), changes
+behaviors, sets values, changes fonts and size hints (including those computed
+from **text_for_bounding_rect**), starts and stops timed progress, then
+destroys the bars, some of them while timed progress is still running.
+
+After a warm up round it records a baseline, and after every round it measures:
+
+    **RSS**
+      The resident memory of the process.
+
+    **Traced memory**
+      Python allocations, through **tracemalloc**.
+
+    **Live widgets**
+      The number of QWidgets alive once the round's bars are destroyed.
+
+    **Live QObjects**
+      The number of QObjects owned by the application or by a top level
+      widget, which also catches timers and other helper objects.
+
+The test fails if any of them grows beyond its threshold, and on failure prints
+the source lines whose Python allocations grew most. Run it from the root of
+the project like this::
+
+    QT_QPA_PLATFORM=offscreen python -m pyqtlineeditprogressbar.soak --iterations 2000000
+
+It exits with status 0 when memory stays bounded, and 1 when it grows.
+
+"""
+# ----------------------------------------------------------------------------
+# ------------------------ Python Standard Library ---------------------------
+# ----------------------------------------------------------------------------
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import pyqtlineeditprogressbar as pqtpbar
+from pyqtlineeditprogressbar import PyQtLineEditProgressBar
+from pyqtlineeditprogressbar.benchmark import _rss_bytes
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+DEFAULT_ITERATIONS = 1000000
+DEFAULT_BARS = 200
+DEFAULT_CYCLES = 50              # update cycles per round
+
+DEFAULT_MAX_RSS_GROWTH_MB = 32.0
+DEFAULT_MAX_TRACED_GROWTH_MB = 4.0
+DEFAULT_MAX_WIDGET_GROWTH = 0
+DEFAULT_MAX_QOBJECT_GROWTH = 0
+
+RECOLOR_EVERY = 10               # cycles between recolor and behavior passes
+TIMED_PROGRESS_EVERY = 7         # every Nth bar of a round runs timed progress
+BOUNDING_RECT_EVERY = 3          # every Nth bar is sized by text_for_bounding_rect
+FONT_POINT_SIZES = [8, 9, 10, 11, 12, 14]
+TOP_ALLOCATIONS = 10
+
+NAMED_COLORS = list(pqtpbar.EMBEDDED_COLORS.values())
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+def _random_color(rng):
+	# Mostly the colors an application reuses, sometimes one never seen before,
+	# which would fill an unbounded color cache
+	if rng.random() < 0.9:
+		return(rng.choice(NAMED_COLORS))
+	return('#{:06x}'.format(rng.randrange(0x1000000)))
+
+def _settle(app):
+	"""Processes deferred deletes and pending events, then collects garbage."""
+	for _ in range(3):
+		app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+		app.processEvents()
+	gc.collect()
+
+def _round(app, layout, bars, cycles, rng):
+	"""Runs one round of bulk work, returning the number of operations done."""
+	widgets = []
+	for i in range(bars):
+		bar = PyQtLineEditProgressBar(
+					contents='soak {}'.format(i),
+					behavior=rng.choice(pqtpbar.BEHAVIORS),
+					progressbar_color=_random_color(rng),
+					render_mode=pqtpbar.RENDER_MODES[i % len(pqtpbar.RENDER_MODES)],
+					text_for_bounding_rect=' 888/888 [88] ' if i % BOUNDING_RECT_EVERY == 0 else None)
+		layout.addWidget(bar)
+		widgets.append(bar)
+	for bar in widgets[::TIMED_PROGRESS_EVERY]:
+		bar.startTimedProgress(rng.uniform(0.05, 0.5))
+	app.processEvents()
+	operations = bars
+
+	for cycle in range(cycles):
+		for bar in widgets:
+			bar.updateProgress(rng.uniform(0.001, 0.05))
+		operations += bars
+
+		if cycle % RECOLOR_EVERY == 0:
+			for bar in widgets:
+				bar.setProgressBarColor(_random_color(rng))
+				bar.setProgressBarBehavior(rng.choice(pqtpbar.BEHAVIORS))
+				bar.setValue(rng.random())
+				bar.setText('soak {}'.format(rng.randrange(1000)))
+				font = QtGui.QFont(bar.font())
+				font.setPointSize(rng.choice(FONT_POINT_SIZES))
+				bar.setFont(font)
+				bar.sizeHint()
+			widgets[cycle % bars].removeProgressBar()
+			operations += 6 * bars + 1
+
+		app.processEvents()
+
+	# Half the timed bars are stopped, the others destroyed while running
+	for bar in widgets[::2 * TIMED_PROGRESS_EVERY]:
+		bar.stopTimedProgress()
+	for bar in widgets:
+		layout.removeWidget(bar)
+		bar.deleteLater()
+	operations += bars
+	_settle(app)
+	return(operations)
+
+def _live_qobjects(app):
+	# Objects owned by the application, such as the timed progress ticker,
+	# plus every top level widget and everything beneath it
+	count = len(app.findChildren(QtCore.QObject))
+	for widget in app.topLevelWidgets():
+		count += 1 + len(widget.findChildren(QtCore.QObject))
+	return(count)
+
+def _measure(app):
+	return({
+		'rss': _rss_bytes(),
+		'traced': tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0,
+		'widgets': len(QtWidgets.QApplication.allWidgets()),
+		'qobjects': _live_qobjects(app),
+	})
+
+def soak(iterations=DEFAULT_ITERATIONS, bars=DEFAULT_BARS, cycles=DEFAULT_CYCLES,
+		max_rss_growth_mb=DEFAULT_MAX_RSS_GROWTH_MB,
+		max_traced_growth_mb=DEFAULT_MAX_TRACED_GROWTH_MB,
+		max_widget_growth=DEFAULT_MAX_WIDGET_GROWTH,
+		max_qobject_growth=DEFAULT_MAX_QOBJECT_GROWTH,
+		trace_allocations=True, seed=0, report=None):
+	"""Runs rounds of bulk work until **iterations** operations have been done,
+	checking after every round that memory stays within the thresholds. A
+	QApplication must already exist, and may be reused for further runs.
+
+	Parameters
+	----------
+	iterations : int, optional
+	  The number of operations (creations, updates, recolors, behavior and value
+	  changes, destructions) to run, after the warm up round.
+
+	bars : int, optional
+	  The number of bars created and destroyed each round.
+
+	cycles : int, optional
+	  The number of update cycles over all the bars each round.
+
+	max_rss_growth_mb : float, optional
+	  The most the resident memory may grow past the baseline, in MiB.
+
+	max_traced_growth_mb : float, optional
+	  The most the memory traced by tracemalloc may grow past the baseline, in MiB.
+
+	max_widget_growth : int, optional
+	  The most the number of live QWidgets may grow past the baseline.
+
+	max_qobject_growth : int, optional
+	  The most the number of live QObjects may grow past the baseline.
+
+	trace_allocations : bool, optional
+	  Whether to run tracemalloc. It slows Python allocations down considerably.
+
+	seed : int, optional
+	  The seed of the random choices, so a failing run can be repeated.
+
+	report : callable, optional
+	  Called with a line of text describing each round.
+
+	Returns
+	-------
+	dict
+	  **passed**; **operations** and **rounds** done; the **baseline** and
+	  **peak** measurements, each a dict of **rss** and **traced** bytes and
+	  live **widgets** and **qobjects**; **failures**, a list of the thresholds exceeded; and
+	  **top_allocations**, the lines whose allocations grew most, if traced.
+	"""
+	app = QtWidgets.QApplication.instance()
+	if app is None:
+		raise RuntimeError('soak() needs a QApplication')
+	rng = random.Random(seed)
+
+	window = QtWidgets.QWidget()
+	window.setFixedSize(400, 300)
+	layout = QtWidgets.QVBoxLayout(window)
+	window.show()
+
+	if trace_allocations:
+		tracemalloc.start()
+
+	# The warm up round fills caches and the allocator's pools
+	_round(app, layout, bars, cycles, rng)
+	baseline = _measure(app)
+	snapshot = tracemalloc.take_snapshot() if trace_allocations else None
+	peak = dict(baseline)
+
+	limits = {
+		'rss': max_rss_growth_mb * 1024 * 1024,
+		'traced': max_traced_growth_mb * 1024 * 1024,
+		'widgets': max_widget_growth,
+		'qobjects': max_qobject_growth,
+	}
+	failures = []
+	operations = 0
+	rounds = 0
+	while operations < iterations:
+		operations += _round(app, layout, bars, cycles, rng)
+		rounds += 1
+
+		current = _measure(app)
+		for key in peak:
+			peak[key] = max(peak[key], current[key])
+		if report is not None:
+			report('round {:4d}  {:10d} ops  RSS {:+8.1f} MiB  traced {:+8.2f} MiB  widgets {:+d}  QObjects {:+d}'.format(
+				rounds, operations,
+				(current['rss'] - baseline['rss']) / 1048576.0,
+				(current['traced'] - baseline['traced']) / 1048576.0,
+				current['widgets'] - baseline['widgets'],
+				current['qobjects'] - baseline['qobjects']))
+
+		failures = [key for key in limits
+					if current[key] - baseline[key] > limits[key]
+					and (key != 'traced' or trace_allocations)]
+		if failures:
+			break
+
+	top_allocations = []
+	if trace_allocations:
+		if failures:
+			top_allocations = [str(stat) for stat in
+								tracemalloc.take_snapshot().compare_to(snapshot, 'lineno')[:TOP_ALLOCATIONS]]
+		tracemalloc.stop()
+
+	window.close()
+	window.deleteLater()
+	_settle(app)
+
+	return({
+		'passed': not failures,
+		'operations': operations,
+		'rounds': rounds,
+		'baseline': baseline,
+		'peak': peak,
+		'failures': failures,
+		'top_allocations': top_allocations,
+	})
+
+# ----------------------------------------------------------------------------
+def main():
+	parser = argparse.ArgumentParser(description='PyQtLineEditProgressBar memory soak test')
+	parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help='number of operations to run')
+	parser.add_argument('--bars', type=int, default=DEFAULT_BARS, help='number of bars per round')
+	parser.add_argument('--cycles', type=int, default=DEFAULT_CYCLES, help='number of update cycles per round')
+	parser.add_argument('--max-rss-growth', type=float, default=DEFAULT_MAX_RSS_GROWTH_MB,
+						help='allowed resident memory growth in MiB')
+	parser.add_argument('--max-traced-growth', type=float, default=DEFAULT_MAX_TRACED_GROWTH_MB,
+						help='allowed tracemalloc growth in MiB')
+	parser.add_argument('--max-widget-growth', type=int, default=DEFAULT_MAX_WIDGET_GROWTH,
+						help='allowed growth in live QWidgets')
+	parser.add_argument('--max-qobject-growth', type=int, default=DEFAULT_MAX_QOBJECT_GROWTH,
+						help='allowed growth in live QObjects')
+	parser.add_argument('--no-tracemalloc', action='store_true', help='do not trace Python allocations')
+	parser.add_argument('--seed', type=int, default=0, help='random seed')
+	parser.add_argument('--quiet', action='store_true', help='only print the result')
+	args = parser.parse_args()
+
+	app = QtWidgets.QApplication([])
+	result = soak(iterations=args.iterations, bars=args.bars, cycles=args.cycles,
+				max_rss_growth_mb=args.max_rss_growth,
+				max_traced_growth_mb=args.max_traced_growth,
+				max_widget_growth=args.max_widget_growth,
+				max_qobject_growth=args.max_qobject_growth,
+				trace_allocations=not args.no_tracemalloc,
+				seed=args.seed,
+				report=None if args.quiet else print)
+
+	print('{} after {} operations in {} rounds, peak RSS {:.1f} MiB (baseline {:.1f} MiB)'.format(
+		'PASSED' if result['passed'] else 'FAILED: ' + ', '.join(result['failures']) + ' grew',
+		result['operations'], result['rounds'],
+		result['peak']['rss'] / 1048576.0, result['baseline']['rss'] / 1048576.0))
+	for line in result['top_allocations']:
+		print('    ' + line)
+	return(0 if result['passed'] else 1)
+
+# ----------------------------------------------------------------------------
+# ----------------------------- main -----------------------------------------
+# ----------------------------------------------------------------------------
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,313 @@
+"""
+.. module:: pyqtlineeditprogressbar.store
+
+**ProgressStore**
+
+An array-backed store for tracking the progress of many jobs at once.
+
+Driving thousands of PyQtLineEditProgressBar widgets through **updateProgress()**
+one Python call at a time is slow when progress events arrive in bulk. A
+ProgressStore holds the value, behavior and color of every row in contiguous
+NumPy arrays and applies the same wrap and clamp semantics as
+**PyQtLineEditProgressBar.updateProgress()** to whole batches of updates at once.
+
+Rows touched by an update are marked dirty, so bound widgets (or item delegates
+reading the store directly) only need to repaint the rows that changed.
+
+This module requires `NumPy <https://pypi.org/project/numpy/>`_, which is an
+optional dependency of this package::
+
+    pip install pyqtlineeditprogressbar[store]
+
+"""
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+import numpy as np
+
+import pyqtlineeditprogressbar as pqtpbar
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+# Per behavior lookup tables, indexed by a behavior's position in BEHAVIORS
+_INIT_VALUES = np.array([pqtpbar.BEHAVIOR_MAP[b][0] for b in pqtpbar.BEHAVIORS], dtype=np.float64)
+_DELTA_SIGNS = np.array([pqtpbar.BEHAVIOR_MAP[b][3] for b in pqtpbar.BEHAVIORS], dtype=np.float64)
+_IS_LEFT_2_RIGHT = np.array([b in pqtpbar.LEFT_2_RIGHT for b in pqtpbar.BEHAVIORS], dtype=bool)
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+def _behavior_index(behavior):
+	if isinstance(behavior, str) and behavior.lower() in pqtpbar.BEHAVIORS:
+		return(pqtpbar.BEHAVIORS.index(behavior.lower()))
+	return(pqtpbar.BEHAVIORS.index(pqtpbar.DEFAULT_BEHAVIOR))
+
+def _color_to_int(color_text):
+	return(int(pqtpbar._validate_color(color_text)[1:], 16))
+
+
+class ProgressStore(object):
+
+	def __init__(self, size,
+				progressbar_color=pqtpbar.EMBEDDED_COLORS[pqtpbar.DECN[0]],
+				behavior=pqtpbar.DEFAULT_BEHAVIOR,
+				):
+		"""Constructor for the ProgressStore Class
+
+		Parameters
+		----------
+		size : int
+		  The number of rows (jobs) held by the store. Rows are addressed by
+		  their integer index, from 0 to size - 1.
+
+		progressbar_color : str, optional
+		  The initial color of every row, validated the same way as
+		  **PyQtLineEditProgressBar.setProgressBarColor()**.
+
+		behavior : str, optional
+		  The initial behavior of every row, one of the four
+		  **pyqtlineeditprogressbar.BEHAVIORS**.
+
+		Returns
+		-------
+		ProgressStore object
+		  A store with every row initialized and marked dirty.
+
+		"""
+		self._size = int(size)
+
+		behavior_index = _behavior_index(behavior)
+		self._behaviors = np.full(self._size, behavior_index, dtype=np.uint8)
+		self._values = np.full(self._size, _INIT_VALUES[behavior_index], dtype=np.float64)
+		self._colors = np.full(self._size, _color_to_int(progressbar_color), dtype=np.uint32)
+		self._dirty = np.ones(self._size, dtype=bool)
+
+		self._bound = {}
+
+	def __len__(self):
+		return(self._size)
+
+	def _advance(self, ids, deltas):
+		# Vectorized form of PyQtLineEditProgressBar.updateProgress(), ids must be unique
+		behaviors = self._behaviors[ids]
+		values = self._values[ids]
+		stepped = values + (_DELTA_SIGNS[behaviors] * deltas)
+
+		left_2_right = np.where(values >= 0.998, 0.001, np.where(values > 0.9, 0.999, stepped))
+		right_2_left = np.where(values <= 0.0010, 0.999, np.where(values < 0.100, 0.001, stepped))
+
+		values = np.where(_IS_LEFT_2_RIGHT[behaviors], left_2_right, right_2_left)
+		np.clip(values, 0.001, 0.999, out=values)
+
+		self._values[ids] = values
+		self._dirty[ids] = True
+
+	# -------------------------------------------------------------------------
+	# Public API
+	# -------------------------------------------------------------------------
+
+	def updateProgress(self, ids, deltas):
+		"""Applies a batch of incremental updates, the bulk equivalent of calling
+		**PyQtLineEditProgressBar.updateProgress()** once per (id, delta) pair.
+
+		Parameters
+		----------
+		ids : array_like of int
+		  The rows to update. A row may appear more than once, in which case its
+		  updates are applied in the order they appear in the batch.
+
+		deltas : array_like of float, or float
+		  The incremental progress for each entry in **ids**, or a single value
+		  applied to all of them.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		ids = np.asarray(ids, dtype=np.intp).ravel()
+		deltas = np.broadcast_to(np.asarray(deltas, dtype=np.float64).ravel(), ids.shape)
+		if ids.size == 0:
+			return
+
+		# Split the batch into rounds in which every row appears at most once,
+		# so repeated rows wrap and clamp exactly as sequential calls would.
+		order = np.argsort(ids, kind='stable')
+		sorted_ids = ids[order]
+		positions = np.arange(ids.size)
+		group_starts = np.ones(ids.size, dtype=bool)
+		group_starts[1:] = sorted_ids[1:] != sorted_ids[:-1]
+		rank = positions - np.maximum.accumulate(np.where(group_starts, positions, 0))
+
+		if not rank.any():
+			self._advance(ids, deltas)
+			return
+
+		for r in range(int(rank.max()) + 1):
+			selected = order[rank == r]
+			self._advance(ids[selected], deltas[selected])
+
+	def setValues(self, ids, values):
+		"""Sets the value of a batch of rows directly, the bulk equivalent of
+		**PyQtLineEditProgressBar.setValue()**.
+
+		Parameters
+		----------
+		ids : array_like of int
+		  The rows to set. If a row appears more than once, the last value wins.
+
+		values : array_like of float, or float
+		  The new value for each entry in **ids**, or a single value applied to
+		  all of them. Values are clamped to [0.001, 0.999].
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		ids = np.asarray(ids, dtype=np.intp).ravel()
+		values = np.broadcast_to(np.asarray(values, dtype=np.float64).ravel(), ids.shape)
+		self._values[ids] = np.clip(values, 0.001, 0.999)
+		self._dirty[ids] = True
+
+	def setProgressBarBehavior(self, ids, behavior):
+		"""Sets the behavior of a batch of rows and resets their values to the
+		behavior's initial value, as **PyQtLineEditProgressBar.setProgressBarBehavior()** does.
+
+		Parameters
+		----------
+		ids : array_like of int
+		  The rows to configure.
+
+		behavior : str
+		  One of the four **pyqtlineeditprogressbar.BEHAVIORS**. Invalid values
+		  fall back to **pyqtlineeditprogressbar.DEFAULT_BEHAVIOR**.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		ids = np.asarray(ids, dtype=np.intp).ravel()
+		behavior_index = _behavior_index(behavior)
+		self._behaviors[ids] = behavior_index
+		self._values[ids] = _INIT_VALUES[behavior_index]
+		self._dirty[ids] = True
+
+	def setProgressBarColor(self, ids, color_text):
+		"""Sets the color of a batch of rows.
+
+		Parameters
+		----------
+		ids : array_like of int
+		  The rows to configure.
+
+		color_text : str
+		  A color validated the same way as **PyQtLineEditProgressBar.setProgressBarColor()**.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		ids = np.asarray(ids, dtype=np.intp).ravel()
+		self._colors[ids] = _color_to_int(color_text)
+		self._dirty[ids] = True
+
+	def getValues(self, ids=None):
+		"""Returns the values of the rows in **ids**, or a read only view of all
+		values if **ids** is not given."""
+		if ids is None:
+			view = self._values.view()
+			view.flags.writeable = False
+			return(view)
+		return(self._values[np.asarray(ids, dtype=np.intp)])
+
+	def getValue(self, row):
+		"""Returns the current value of a single row, between 0.0 and 1.0."""
+		return(float(self._values[row]))
+
+	def getBehavior(self, row):
+		"""Returns the behavior string of a single row."""
+		return(pqtpbar.BEHAVIORS[self._behaviors[row]])
+
+	def getProgressBarColor(self, row):
+		"""Returns the color of a single row as a long hex string, such as #aaff7f."""
+		return('#{:06x}'.format(int(self._colors[row])))
+
+	def dirtyRows(self):
+		"""Returns a sorted array of the rows changed since they were last cleared."""
+		return(np.flatnonzero(self._dirty))
+
+	def clearDirty(self, ids=None):
+		"""Clears the dirty flag of the rows in **ids**, or of every row if
+		**ids** is not given."""
+		if ids is None:
+			self._dirty[:] = False
+		else:
+			self._dirty[np.asarray(ids, dtype=np.intp)] = False
+
+	def takeDirty(self):
+		"""Returns the dirty rows, as **dirtyRows()** does, and clears them."""
+		rows = self.dirtyRows()
+		self._dirty[rows] = False
+		return(rows)
+
+	def bind(self, row, widget):
+		"""Binds a PyQtLineEditProgressBar widget to a row, so that **sync()**
+		keeps the widget's value, color and behavior in step with the row.
+
+		Parameters
+		----------
+		row : int
+		  The row to bind.
+
+		widget : PyQtLineEditProgressBar
+		  The widget displaying the row. Any previously bound widget is replaced.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		self._bound[int(row)] = widget
+		self._dirty[row] = True
+
+	def unbind(self, row):
+		"""Removes the widget bound to **row**, if any."""
+		self._bound.pop(int(row), None)
+
+	def sync(self):
+		"""Pushes every dirty row into its bound widget, if it has one, and
+		clears the dirty set.
+
+		Parameters
+		----------
+		None
+		  Nothing
+
+		Returns
+		-------
+		numpy.ndarray
+		  The rows that were dirty, including rows with no bound widget, so
+		  callers driving item delegates can repaint them too.
+		"""
+		rows = self.takeDirty()
+		if not self._bound:
+			return(rows)
+
+		for row in rows.tolist():
+			widget = self._bound.get(row)
+			if widget is None:
+				continue
+			behavior = pqtpbar.BEHAVIORS[self._behaviors[row]]
+			if widget.getBehavior() != behavior:
+				widget.setProgressBarBehavior(behavior)
+			color = self.getProgressBarColor(row)
+			if widget.getProgressBarColor() != color:
+				widget.setProgressBarColor(color)
+			widget.setValue(float(self._values[row]))
+
+		return(rows)
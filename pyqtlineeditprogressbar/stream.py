@@ -0,0 +1,322 @@
+"""
+.. module:: pyqtlineeditprogressbar.stream
+
+**ProgressStreamMonitor**
+
+Feeds progress bars from the text output of subprocesses, without blocking.
+
+Command line tools such as rsync, pip or build tools report progress as text,
+often rewriting one line in place with carriage returns. A ProgressStreamMonitor
+reads their output incrementally, in chunks, as the event loop reports it is
+available, from a **QProcess** or from any pipe through a **QSocketNotifier**.
+Output is split on both newlines and carriage returns, the newest complete
+segment a parser recognizes is applied, and the bar is only updated when the
+parsed fraction actually changes.
+
+Everything runs on the GUI thread's event loop, so hundreds of concurrent
+subprocesses need no thread each::
+
+    monitor = ProgressStreamMonitor()
+
+    process = monitor.start('rsync', ['-a', '--info=progress2', src, dst], bar)
+
+    # or, for a process started some other way
+    monitor.watchProcess(process, bar, parser=DONE_OF_TOTAL_PARSER)
+
+A parser is any callable that takes one line of output and returns the fraction
+of work completed, between 0.0 and 1.0, or None if the line carries no
+progress. **RegexProgressParser** builds one from a regular expression with a
+**percent** group, or **done** and **total** groups.
+
+"""
+# ----------------------------------------------------------------------------
+# ------------------------ Python Standard Library ---------------------------
+# ----------------------------------------------------------------------------
+import codecs
+import os
+import re
+
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import QtCore
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+CHUNK_SIZE = 65536           # bytes read from a pipe at a time
+MAX_PENDING_TEXT = 65536     # an unterminated segment longer than this is dropped
+
+# Splits output on newlines and on the carriage returns used for in-place updates
+LINE_SEPARATOR = re.compile(r'\r\n|\r|\n')
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+class RegexProgressParser(object):
+	"""A progress parser built from a regular expression, compiled once.
+
+	The expression must have either a **percent** group, or **done** and
+	**total** groups. Numbers may contain thousands separators (commas).
+	"""
+
+	__slots__ = ('_search', '_percent')
+
+	def __init__(self, pattern, flags=0):
+		regex = re.compile(pattern, flags)
+		groups = regex.groupindex
+		if 'percent' in groups:
+			self._percent = True
+		elif 'done' in groups and 'total' in groups:
+			self._percent = False
+		else:
+			raise ValueError("Parser pattern needs a 'percent' group, or 'done' and 'total' groups")
+		self._search = regex.search
+
+	def __call__(self, line):
+		match = self._search(line)
+		if match is None:
+			return(None)
+		try:
+			if self._percent:
+				return(float(match.group('percent').replace(',', '')) / 100.0)
+			total = float(match.group('total').replace(',', ''))
+			if total <= 0:
+				return(None)
+			return(float(match.group('done').replace(',', '')) / total)
+		except ValueError:
+			return(None)
+
+
+PERCENT_PARSER = RegexProgressParser(r'(?P<percent>\d+(?:\.\d+)?)\s*%')
+DONE_OF_TOTAL_PARSER = RegexProgressParser(r'(?P<done>[\d,]+)\s*(?:/|of)\s*(?P<total>[\d,]+)')
+
+PARSERS = {
+	'percent' : PERCENT_PARSER,
+	'done-of-total' : DONE_OF_TOTAL_PARSER,
+}
+DEFAULT_PARSER = PERCENT_PARSER
+
+
+class _ProgressFeed(object):
+	"""Turns chunks of one output channel into progressbar updates."""
+
+	__slots__ = ('bar', 'parser', 'last', '_decoder', '_pending')
+
+	def __init__(self, bar, parser):
+		self.bar = bar
+		self.parser = parser
+		self.last = None
+		self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+		self._pending = ''
+
+	def feed(self, data, final=False):
+		text = self._pending + self._decoder.decode(data, final)
+		segments = LINE_SEPARATOR.split(text)
+		# The last segment is unterminated, unless the stream has ended
+		self._pending = '' if final else segments.pop()
+		if len(self._pending) > MAX_PENDING_TEXT:
+			self._pending = ''
+
+		# Only the newest progress matters, so parse from the end backwards
+		parser = self.parser
+		for segment in reversed(segments):
+			if segment:
+				fraction = parser(segment)
+				if fraction is not None:
+					self._apply(fraction)
+					return
+
+	def _apply(self, fraction):
+		fraction = min(max(fraction, 0.0), 1.0)
+		if fraction != self.last:
+			self.last = fraction
+			self.bar.setProgressFraction(fraction)
+
+
+class ProgressStreamMonitor(QtCore.QObject):
+
+	# Emitted with the bar when a watched process finishes or a watched pipe closes
+	finished = QtCore.pyqtSignal(object)
+
+	def __init__(self, parent=None):
+		"""Constructor for the ProgressStreamMonitor Class
+
+		Parameters
+		----------
+		parent : QObject reference, optional
+		  The parent object.
+
+		Returns
+		-------
+		ProgressStreamMonitor object
+			A monitor watching nothing.
+
+		"""
+		super(ProgressStreamMonitor, self).__init__(parent)
+		self._processes = {}     # QProcess -> (stdout feed, stderr feed, connections)
+		self._notifiers = {}     # file descriptor -> (QSocketNotifier, feed)
+
+	# -------------------------------------------------------------------------
+	# QProcess sources
+	# -------------------------------------------------------------------------
+
+	def _read_process(self, process, error_channel):
+		feeds = self._processes.get(process)
+		if feeds is None:
+			return
+		if error_channel:
+			feeds[1].feed(bytes(process.readAllStandardError()))
+		else:
+			feeds[0].feed(bytes(process.readAllStandardOutput()))
+
+	def _process_finished(self, process):
+		feeds = self._processes.get(process)
+		if feeds is None:
+			return
+		feeds[0].feed(bytes(process.readAllStandardOutput()), final=True)
+		feeds[1].feed(bytes(process.readAllStandardError()), final=True)
+		bar = feeds[0].bar
+		self.unwatchProcess(process)
+		self.finished.emit(bar)
+
+	def watchProcess(self, process, bar, parser=DEFAULT_PARSER):
+		"""Feeds a bar from the standard output and standard error of a process.
+
+		Parameters
+		----------
+		process : QProcess
+		  The process to watch. It may be started before or after this call.
+		  Both output channels are parsed separately, so in-place updates on
+		  one are not garbled by the other.
+
+		bar : PyQtLineEditProgressBar
+		  The bar to feed, through **setProgressFraction()**. Any object with
+		  that method can be fed.
+
+		parser : callable, optional
+		  Returns the fraction completed for a line, or None. One of
+		  **PARSERS**, a **RegexProgressParser**, or any callable.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		self.unwatchProcess(process)
+		connections = (
+			process.readyReadStandardOutput.connect(lambda: self._read_process(process, False)),
+			process.readyReadStandardError.connect(lambda: self._read_process(process, True)),
+			process.finished.connect(lambda *args: self._process_finished(process)),
+		)
+		self._processes[process] = (_ProgressFeed(bar, parser), _ProgressFeed(bar, parser), connections)
+
+	def unwatchProcess(self, process):
+		"""Stops feeding a bar from a process. The process itself is left running."""
+		feeds = self._processes.pop(process, None)
+		if feeds is None:
+			return
+		for connection in feeds[2]:
+			process.disconnect(connection)
+
+	def start(self, program, arguments, bar, parser=DEFAULT_PARSER):
+		"""Starts a program in a new QProcess, owned by the monitor, and feeds a
+		bar from its output. The process is deleted once it has finished.
+
+		Parameters
+		----------
+		program : str
+		  The program to run.
+
+		arguments : list of str
+		  Its arguments.
+
+		bar : PyQtLineEditProgressBar
+		  The bar to feed.
+
+		parser : callable, optional
+		  As for **watchProcess()**.
+
+		Returns
+		-------
+		QProcess
+		  The started process.
+		"""
+		process = QtCore.QProcess(self)
+		self.watchProcess(process, bar, parser)
+		process.finished.connect(process.deleteLater)
+		process.start(program, arguments)
+		return(process)
+
+	# -------------------------------------------------------------------------
+	# File descriptor sources
+	# -------------------------------------------------------------------------
+
+	def _read_descriptor(self, fd):
+		entry = self._notifiers.get(fd)
+		if entry is None:
+			return
+		feed = entry[1]
+		# One chunk per notification. The notifier fires again while data
+		# remains, so a fast producer cannot starve other pipes and timers.
+		try:
+			data = os.read(fd, CHUNK_SIZE)
+		except BlockingIOError:
+			return
+		except OSError:
+			data = b''
+		if not data:
+			feed.feed(b'', final=True)
+			self.unwatchFileDescriptor(fd)
+			self.finished.emit(feed.bar)
+			return
+		feed.feed(data)
+
+	def watchFileDescriptor(self, fd, bar, parser=DEFAULT_PARSER):
+		"""Feeds a bar from a pipe, for example the **stdout** of a
+		**subprocess.Popen**, through a QSocketNotifier.
+
+		The descriptor is switched to non-blocking mode, and one chunk is read
+		each time the event loop reports it readable. Closing the descriptor
+		stays the caller's responsibility. On Windows QSocketNotifier only
+		supports sockets, so use **watchProcess()** there.
+
+		Parameters
+		----------
+		fd : int or file object
+		  The descriptor to read, or an object with a **fileno()** method.
+
+		bar : PyQtLineEditProgressBar
+		  The bar to feed.
+
+		parser : callable, optional
+		  As for **watchProcess()**.
+
+		Returns
+		-------
+		None
+		  Nothing
+		"""
+		if hasattr(fd, 'fileno'):
+			fd = fd.fileno()
+		self.unwatchFileDescriptor(fd)
+		os.set_blocking(fd, False)
+		notifier = QtCore.QSocketNotifier(fd, QtCore.QSocketNotifier.Read, self)
+		notifier.activated.connect(self._read_descriptor)
+		self._notifiers[fd] = (notifier, _ProgressFeed(bar, parser))
+
+	def unwatchFileDescriptor(self, fd):
+		"""Stops reading a descriptor. It is not closed."""
+		if hasattr(fd, 'fileno'):
+			fd = fd.fileno()
+		entry = self._notifiers.pop(fd, None)
+		if entry is None:
+			return
+		notifier = entry[0]
+		notifier.setEnabled(False)
+		notifier.deleteLater()
+
+	def watchCount(self):
+		"""Returns the number of processes and descriptors being watched."""
+		return(len(self._processes) + len(self._notifiers))
@@ -0,0 +1,205 @@
+"""
+Stress demo source for PyQtLineEditProgressBar
+
+Drives hundreds to thousands of progress bars from background worker threads.
+
+Worker threads never touch the widgets. They append (bar index, delta) events
+to a shared queue, and a timer on the GUI thread drains the queue once per
+frame, coalescing all the deltas for a bar into a single **updateProgress()**
+call. The window shows the frame rate the event loop sustains, the rate of
+progress events consumed, and lets you switch render modes, or hand the
+bars to a FrameBudgetGovernor, while it runs.
+
+Run it from the root of the project like this::
+
+    python -m pyqtlineeditprogressbar.stress --bars 1000 --workers 4
+
+"""
+# ----------------------------------------------------------------------------
+# ------------------------ Python Standard Library ---------------------------
+# ----------------------------------------------------------------------------
+import argparse
+import collections
+import random
+import threading
+import time
+
+# ----------------------------------------------------------------------------
+# -------------------------- Third Party Packages ----------------------------
+# ----------------------------------------------------------------------------
+from PyQt5 import QtCore
+from PyQt5 import QtWidgets
+
+import pyqtlineeditprogressbar as pqtpbar
+from pyqtlineeditprogressbar import FRAME_INTERVAL_MS
+from pyqtlineeditprogressbar import PyQtLineEditProgressBar
+from pyqtlineeditprogressbar.governor import FrameBudgetGovernor
+
+# ----------------------------------------------------------------------------
+# ----------------------- Module Global & Constants --------------------------
+# ----------------------------------------------------------------------------
+
+COLUMNS = 4
+
+COLORS = [pqtpbar.EMBEDDED_COLORS[name] for name in pqtpbar.DECN]
+
+# ----------------------------------------------------------------------------
+# --------------------- Module Classes & Functions ---------------------------
+# ----------------------------------------------------------------------------
+class ProgressWorker(threading.Thread):
+	"""A background thread that simulates jobs reporting progress, by appending
+	(bar index, delta) events to **events** at roughly **rate** events per second."""
+
+	def __init__(self, events, bars, rate):
+		super(ProgressWorker, self).__init__(daemon=True)
+		self._events = events
+		self._bars = bars
+		self._rate = rate
+		self._stop = threading.Event()
+
+	def run(self):
+		batch = max(1, self._rate // 100)
+		while not self._stop.wait(batch / float(self._rate)):
+			for _ in range(batch):
+				self._events.append((random.randrange(self._bars), random.uniform(0.001, 0.02)))
+
+	def stop(self):
+		self._stop.set()
+
+
+class StressDialog(QtWidgets.QDialog):
+
+	def __init__(self, bars=1000, workers=4, rate=5000, parent=None):
+		QtWidgets.QDialog.__init__(self, parent)
+		self.setWindowTitle("PyQtLineEditProgressBar Stress Demo")
+
+		# deque.append() and deque.popleft() are thread safe, so this is the
+		# only thing shared between the workers and the GUI thread.
+		self._events = collections.deque()
+
+		self._bars = []
+		grid = QtWidgets.QGridLayout()
+		for i in range(bars):
+			bar = PyQtLineEditProgressBar(
+						contents='job {}'.format(i),
+						behavior=pqtpbar.BEHAVIORS[i % len(pqtpbar.BEHAVIORS)],
+						progressbar_color=COLORS[i % len(COLORS)])
+			bar.setAlignment(QtCore.Qt.AlignCenter)
+			grid.addWidget(bar, i // COLUMNS, i % COLUMNS)
+			self._bars.append(bar)
+
+		container = QtWidgets.QWidget()
+		container.setLayout(grid)
+		scroll = QtWidgets.QScrollArea()
+		scroll.setWidgetResizable(True)
+		scroll.setWidget(container)
+
+		self._render_mode = QtWidgets.QComboBox()
+		self._render_mode.addItems(pqtpbar.RENDER_MODES)
+		self._render_mode.currentTextChanged.connect(self.renderModeChanged)
+
+		self._governed = QtWidgets.QCheckBox('Frame budget governor')
+		self._governed.toggled.connect(self.governorToggled)
+		self._governor = None
+
+		self._status = QtWidgets.QLabel()
+
+		controls = QtWidgets.QHBoxLayout()
+		controls.addWidget(QtWidgets.QLabel('Render mode:'))
+		controls.addWidget(self._render_mode)
+		controls.addWidget(self._governed)
+		controls.addStretch()
+		controls.addWidget(self._status)
+
+		mainLayout = QtWidgets.QVBoxLayout()
+		mainLayout.addLayout(controls)
+		mainLayout.addWidget(scroll)
+		self.setLayout(mainLayout)
+
+		self._frames = 0
+		self._consumed = 0
+		self._last_report = time.perf_counter()
+
+		self._timer = QtCore.QTimer(self)
+		self._timer.timeout.connect(self.drainEvents)
+		self._timer.start(FRAME_INTERVAL_MS)
+
+		self._workers = [ProgressWorker(self._events, bars, max(1, rate // max(1, workers)))
+						for _ in range(workers)]
+		for worker in self._workers:
+			worker.start()
+
+	def drainEvents(self):
+		# Coalesce everything that arrived since the last frame
+		pending = collections.defaultdict(float)
+		events = self._events
+		count = len(events)
+		for _ in range(count):
+			index, delta = events.popleft()
+			pending[index] += delta
+
+		if self._governor is None:
+			for index, delta in pending.items():
+				self._bars[index].updateProgress(delta)
+		else:
+			for index, delta in pending.items():
+				self._governor.updateProgress(self._bars[index], delta)
+
+		self._frames += 1
+		self._consumed += count
+
+		now = time.perf_counter()
+		elapsed = now - self._last_report
+		if elapsed >= 1.0:
+			status = '{:5.1f} FPS   {:8.0f} events/s   {} bars updated last frame'.format(
+				self._frames / elapsed, self._consumed / elapsed, len(pending))
+			if self._governor is not None:
+				status += '   degradation level {} ({:.1f} ms/frame)'.format(
+					self._governor.degradationLevel(), self._governor.frameCost())
+			self._status.setText(status)
+			self._frames = 0
+			self._consumed = 0
+			self._last_report = now
+
+	def renderModeChanged(self, render_mode):
+		for bar in self._bars:
+			bar.setRenderMode(render_mode)
+
+	def governorToggled(self, checked):
+		if checked:
+			self._governor = FrameBudgetGovernor(parent=self)
+			for bar in self._bars:
+				self._governor.register(bar)
+		else:
+			self._governor.stop()
+			self._governor.deleteLater()
+			self._governor = None
+		self._render_mode.setEnabled(not checked)
+
+	def done(self, result):
+		self._timer.stop()
+		if self._governor is not None:
+			self._governor.stop()
+		for worker in self._workers:
+			worker.stop()
+		QtWidgets.QDialog.done(self, result)
+
+# ----------------------------------------------------------------------------
+def main():
+	parser = argparse.ArgumentParser(description='PyQtLineEditProgressBar stress demo')
+	parser.add_argument('--bars', type=int, default=1000, help='number of progress bars')
+	parser.add_argument('--workers', type=int, default=4, help='number of worker threads')
+	parser.add_argument('--rate', type=int, default=5000, help='total progress events per second')
+	args = parser.parse_args()
+
+	app = QtWidgets.QApplication([])
+	window = StressDialog(bars=args.bars, workers=args.workers, rate=args.rate)
+	window.resize(900, 700)
+	window.show()
+	app.exec_()
+
+# ----------------------------------------------------------------------------
+# ----------------------------- main -----------------------------------------
+# ----------------------------------------------------------------------------
+if __name__ == "__main__":
+	main()
@@ -26,6 +26,9 @@ setup(name='pyqtlineeditprogressbar',
 		'PyQt5>=5.14.0',
 		'colour>=0.1.5',
 		],
+		extras_require={
+		'store': ['numpy>=1.16'],
+		},
 		classifiers = [
 			'Development Status :: 4 - Beta',
 			'Intended Audience :: Developers',